@@ -1,7 +1,5 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
-from Crypto.Cipher import DES
-from Crypto.Util.Padding import pad, unpad
 import base64
 
 def update_key_length():
@@ -11,6 +9,10 @@ def update_key_length():
 
 def encrypt_message():
     try:
+        # PyCryptodome is imported on first use so the window opens without waiting for it
+        from Crypto.Cipher import DES
+        from Crypto.Util.Padding import pad
+
         user_key = key_entry.get().encode()  # Convert input to bytes
 
         # Validate key length
@@ -50,6 +52,10 @@ def encrypt_message():
 
 def decrypt_message():
     try:
+        # PyCryptodome is imported on first use so the window opens without waiting for it
+        from Crypto.Cipher import DES
+        from Crypto.Util.Padding import unpad
+
         user_key = key_entry.get().encode()  # Convert input to bytes
 
         # Validate key length
@@ -86,141 +92,144 @@ def decrypt_message():
     except Exception as e:
         messagebox.showerror("Error", str(e))
 
-# Create the main window
-root = tk.Tk()
-root.title("DES Encryption/Decryption")
-
-# Set a modern style
-style = ttk.Style()
-style.configure("TLabel", font=("Helvetica", 10))
-style.configure("TButton", font=("Helvetica", 10), padding=5)
-style.configure("TEntry", font=("Helvetica", 10), padding=5)
-style.configure("TText", font=("Helvetica", 10), padding=5)
-
-# Create a frame for the encryption and decryption layout
-main_frame = ttk.Frame(root)
-main_frame.pack(pady=10)
-
-# Create left frame for encryption
-encrypt_frame = ttk.Frame(main_frame)
-encrypt_frame.pack(side=tk.LEFT, padx=10)
-
-# Input text area for encryption
-encrypt_label = ttk.Label(encrypt_frame, text="Input Message for Encryption:")
-encrypt_label.pack(pady=(10, 0))
-encrypt_input_frame = ttk.Frame(encrypt_frame)
-encrypt_input_frame.pack()
-
-encrypt_input_text = tk.Text(encrypt_input_frame, height=6, width=50)
-encrypt_input_text.pack(side=tk.LEFT)
-
-encrypt_input_scrollbar = tk.Scrollbar(encrypt_input_frame, command=encrypt_input_text.yview)
-encrypt_input_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-encrypt_input_text.config(yscrollcommand=encrypt_input_scrollbar.set)
-
-# Secret key entry for encryption
-key_entry_label = ttk.Label(encrypt_frame, text="Enter Secret Key (8 bytes):")
-key_entry_label.pack(pady=(10, 0))
-key_entry = ttk.Entry(encrypt_frame)  # Removed show="*"
-key_entry.pack(pady=5)
-key_entry.bind("<KeyRelease>", lambda event: update_key_length())  # Update key length on key release
-
-# Key length display for encryption
-key_length_label = ttk.Label(encrypt_frame, text="Key Length: 0 bytes")
-key_length_label.pack(pady=(5, 0))
-
-# Output format selection for encryption
-output_format_label = ttk.Label(encrypt_frame, text="Select Output Format:")
-output_format_label.pack(pady=(10, 0))
-output_format_var = tk.StringVar(value="hex")  # Default value
-hex_radio = ttk.Radiobutton(encrypt_frame, text="Hex", variable=output_format_var, value="hex")
-base64_radio = ttk.Radiobutton(encrypt_frame, text="Base64", variable=output_format_var, value="base64")
-hex_radio.pack(pady=2)
-base64_radio.pack(pady=2)
-
-# Padding selection for encryption
-padding_label = ttk.Label(encrypt_frame, text="Select Padding Method:")
-padding_label.pack(pady=(10, 0))
-padding_var = tk.StringVar(value="PKCS7")  # Default value
-padding_dropdown = ttk.OptionMenu(encrypt_frame, padding_var, "PKCS7", "PKCS7", "Zero Padding")
-padding_dropdown.pack(pady=5)
-
-# Encrypt button
-encrypt_button = ttk.Button(encrypt_frame, text="Encrypt", command=encrypt_message)
-encrypt_button.pack(pady=(10, 5))
-
-# Encrypted text area for output
-encrypted_label = ttk.Label(encrypt_frame, text="Encrypted Message (Hex/Base64):")
-encrypted_label.pack(pady=(10, 0))
-encrypted_output_frame = ttk.Frame(encrypt_frame)
-encrypted_output_frame.pack()
-
-encrypted_output_text = tk.Text(encrypted_output_frame, height=6, width=50)
-encrypted_output_text.pack(side=tk.LEFT)
-
-encrypted_output_scrollbar = tk.Scrollbar(encrypted_output_frame, command=encrypted_output_text.yview)
-encrypted_output_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-encrypted_output_text.config(yscrollcommand=encrypted_output_scrollbar.set)
-
-# Create right frame for decryption
-decrypt_frame = ttk.Frame(main_frame)
-decrypt_frame.pack(side=tk.RIGHT, padx=10)
-
-# Input text area for decryption
-decrypt_label = ttk.Label(decrypt_frame, text="Input Encrypted Message:")
-decrypt_label.pack(pady=(10, 0))
-decrypt_input_frame = ttk.Frame(decrypt_frame)
-decrypt_input_frame.pack()
-
-decrypt_input_text = tk.Text(decrypt_input_frame, height=6, width=50)
-decrypt_input_text.pack(side=tk.LEFT)
-
-decrypt_input_scrollbar = tk.Scrollbar(decrypt_input_frame, command=decrypt_input_text.yview)
-decrypt_input_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-decrypt_input_text.config(yscrollcommand=decrypt_input_scrollbar.set)
-
-# Secret key entry for decryption (same as encryption)
-decrypt_key_entry_label = ttk.Label(decrypt_frame, text="Enter Secret Key (8 bytes):")
-decrypt_key_entry_label.pack(pady=(10, 0))
-decrypt_key_entry = ttk.Entry(decrypt_frame)  # Removed show="*"
-decrypt_key_entry.pack(pady=5)
-
-# Key length display for decryption
-decrypt_key_length_label = ttk.Label(decrypt_frame, text="Key Length: 0 bytes")
-decrypt_key_length_label.pack(pady=(5, 0))
-
-# Output format selection for decryption (same as encryption)
-decrypt_output_format_label = ttk.Label(decrypt_frame, text="Select Output Format:")
-decrypt_output_format_label.pack(pady=(10, 0))
-decrypt_output_format_var = tk.StringVar(value="hex")  # Default value
-decrypt_hex_radio = ttk.Radiobutton(decrypt_frame, text="Hex", variable=decrypt_output_format_var, value="hex")
-decrypt_base64_radio = ttk.Radiobutton(decrypt_frame, text="Base64", variable=decrypt_output_format_var, value="base64")
-decrypt_hex_radio.pack(pady=2)
-decrypt_base64_radio.pack(pady=2)
-
-# Padding selection for decryption (same as encryption)
-decrypt_padding_label = ttk.Label(decrypt_frame, text="Select Padding Method:")
-decrypt_padding_label.pack(pady=(10, 0))
-decrypt_padding_var = tk.StringVar(value="PKCS7")  # Default value
-decrypt_padding_dropdown = ttk.OptionMenu(decrypt_frame, decrypt_padding_var, "PKCS7", "PKCS7", "Zero Padding")
-decrypt_padding_dropdown.pack(pady=5)
-
-# Decrypt button
-decrypt_button = ttk.Button(decrypt_frame, text="Decrypt", command=decrypt_message)
-decrypt_button.pack(pady=(10, 5))
-
-# Decrypted text area for output
-decrypted_label = ttk.Label(decrypt_frame, text="Decrypted Message:")
-decrypted_label.pack(pady=(10, 0))
-decrypted_output_frame = ttk.Frame(decrypt_frame)
-decrypted_output_frame.pack()
-
-decrypted_output_text = tk.Text(decrypted_output_frame, height=6, width=50)
-decrypted_output_text.pack(side=tk.LEFT)
-
-decrypted_output_scrollbar = tk.Scrollbar(decrypted_output_frame, command=decrypted_output_text.yview)
-decrypted_output_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-decrypted_output_text.config(yscrollcommand=decrypted_output_scrollbar.set)
-
-# Start the Tkinter main loop
-root.mainloop()
\ No newline at end of file
+# The GUI is only built when run as a script (or through launcher.py), so
+# importing this module has no side effects
+if __name__ == "__main__":
+    # Create the main window
+    root = tk.Tk()
+    root.title("DES Encryption/Decryption")
+
+    # Set a modern style
+    style = ttk.Style()
+    style.configure("TLabel", font=("Helvetica", 10))
+    style.configure("TButton", font=("Helvetica", 10), padding=5)
+    style.configure("TEntry", font=("Helvetica", 10), padding=5)
+    style.configure("TText", font=("Helvetica", 10), padding=5)
+
+    # Create a frame for the encryption and decryption layout
+    main_frame = ttk.Frame(root)
+    main_frame.pack(pady=10)
+
+    # Create left frame for encryption
+    encrypt_frame = ttk.Frame(main_frame)
+    encrypt_frame.pack(side=tk.LEFT, padx=10)
+
+    # Input text area for encryption
+    encrypt_label = ttk.Label(encrypt_frame, text="Input Message for Encryption:")
+    encrypt_label.pack(pady=(10, 0))
+    encrypt_input_frame = ttk.Frame(encrypt_frame)
+    encrypt_input_frame.pack()
+
+    encrypt_input_text = tk.Text(encrypt_input_frame, height=6, width=50)
+    encrypt_input_text.pack(side=tk.LEFT)
+
+    encrypt_input_scrollbar = tk.Scrollbar(encrypt_input_frame, command=encrypt_input_text.yview)
+    encrypt_input_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    encrypt_input_text.config(yscrollcommand=encrypt_input_scrollbar.set)
+
+    # Secret key entry for encryption
+    key_entry_label = ttk.Label(encrypt_frame, text="Enter Secret Key (8 bytes):")
+    key_entry_label.pack(pady=(10, 0))
+    key_entry = ttk.Entry(encrypt_frame)  # Removed show="*"
+    key_entry.pack(pady=5)
+    key_entry.bind("<KeyRelease>", lambda event: update_key_length())  # Update key length on key release
+
+    # Key length display for encryption
+    key_length_label = ttk.Label(encrypt_frame, text="Key Length: 0 bytes")
+    key_length_label.pack(pady=(5, 0))
+
+    # Output format selection for encryption
+    output_format_label = ttk.Label(encrypt_frame, text="Select Output Format:")
+    output_format_label.pack(pady=(10, 0))
+    output_format_var = tk.StringVar(value="hex")  # Default value
+    hex_radio = ttk.Radiobutton(encrypt_frame, text="Hex", variable=output_format_var, value="hex")
+    base64_radio = ttk.Radiobutton(encrypt_frame, text="Base64", variable=output_format_var, value="base64")
+    hex_radio.pack(pady=2)
+    base64_radio.pack(pady=2)
+
+    # Padding selection for encryption
+    padding_label = ttk.Label(encrypt_frame, text="Select Padding Method:")
+    padding_label.pack(pady=(10, 0))
+    padding_var = tk.StringVar(value="PKCS7")  # Default value
+    padding_dropdown = ttk.OptionMenu(encrypt_frame, padding_var, "PKCS7", "PKCS7", "Zero Padding")
+    padding_dropdown.pack(pady=5)
+
+    # Encrypt button
+    encrypt_button = ttk.Button(encrypt_frame, text="Encrypt", command=encrypt_message)
+    encrypt_button.pack(pady=(10, 5))
+
+    # Encrypted text area for output
+    encrypted_label = ttk.Label(encrypt_frame, text="Encrypted Message (Hex/Base64):")
+    encrypted_label.pack(pady=(10, 0))
+    encrypted_output_frame = ttk.Frame(encrypt_frame)
+    encrypted_output_frame.pack()
+
+    encrypted_output_text = tk.Text(encrypted_output_frame, height=6, width=50)
+    encrypted_output_text.pack(side=tk.LEFT)
+
+    encrypted_output_scrollbar = tk.Scrollbar(encrypted_output_frame, command=encrypted_output_text.yview)
+    encrypted_output_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    encrypted_output_text.config(yscrollcommand=encrypted_output_scrollbar.set)
+
+    # Create right frame for decryption
+    decrypt_frame = ttk.Frame(main_frame)
+    decrypt_frame.pack(side=tk.RIGHT, padx=10)
+
+    # Input text area for decryption
+    decrypt_label = ttk.Label(decrypt_frame, text="Input Encrypted Message:")
+    decrypt_label.pack(pady=(10, 0))
+    decrypt_input_frame = ttk.Frame(decrypt_frame)
+    decrypt_input_frame.pack()
+
+    decrypt_input_text = tk.Text(decrypt_input_frame, height=6, width=50)
+    decrypt_input_text.pack(side=tk.LEFT)
+
+    decrypt_input_scrollbar = tk.Scrollbar(decrypt_input_frame, command=decrypt_input_text.yview)
+    decrypt_input_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    decrypt_input_text.config(yscrollcommand=decrypt_input_scrollbar.set)
+
+    # Secret key entry for decryption (same as encryption)
+    decrypt_key_entry_label = ttk.Label(decrypt_frame, text="Enter Secret Key (8 bytes):")
+    decrypt_key_entry_label.pack(pady=(10, 0))
+    decrypt_key_entry = ttk.Entry(decrypt_frame)  # Removed show="*"
+    decrypt_key_entry.pack(pady=5)
+
+    # Key length display for decryption
+    decrypt_key_length_label = ttk.Label(decrypt_frame, text="Key Length: 0 bytes")
+    decrypt_key_length_label.pack(pady=(5, 0))
+
+    # Output format selection for decryption (same as encryption)
+    decrypt_output_format_label = ttk.Label(decrypt_frame, text="Select Output Format:")
+    decrypt_output_format_label.pack(pady=(10, 0))
+    decrypt_output_format_var = tk.StringVar(value="hex")  # Default value
+    decrypt_hex_radio = ttk.Radiobutton(decrypt_frame, text="Hex", variable=decrypt_output_format_var, value="hex")
+    decrypt_base64_radio = ttk.Radiobutton(decrypt_frame, text="Base64", variable=decrypt_output_format_var, value="base64")
+    decrypt_hex_radio.pack(pady=2)
+    decrypt_base64_radio.pack(pady=2)
+
+    # Padding selection for decryption (same as encryption)
+    decrypt_padding_label = ttk.Label(decrypt_frame, text="Select Padding Method:")
+    decrypt_padding_label.pack(pady=(10, 0))
+    decrypt_padding_var = tk.StringVar(value="PKCS7")  # Default value
+    decrypt_padding_dropdown = ttk.OptionMenu(decrypt_frame, decrypt_padding_var, "PKCS7", "PKCS7", "Zero Padding")
+    decrypt_padding_dropdown.pack(pady=5)
+
+    # Decrypt button
+    decrypt_button = ttk.Button(decrypt_frame, text="Decrypt", command=decrypt_message)
+    decrypt_button.pack(pady=(10, 5))
+
+    # Decrypted text area for output
+    decrypted_label = ttk.Label(decrypt_frame, text="Decrypted Message:")
+    decrypted_label.pack(pady=(10, 0))
+    decrypted_output_frame = ttk.Frame(decrypt_frame)
+    decrypted_output_frame.pack()
+
+    decrypted_output_text = tk.Text(decrypted_output_frame, height=6, width=50)
+    decrypted_output_text.pack(side=tk.LEFT)
+
+    decrypted_output_scrollbar = tk.Scrollbar(decrypted_output_frame, command=decrypted_output_text.yview)
+    decrypted_output_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    decrypted_output_text.config(yscrollcommand=decrypted_output_scrollbar.set)
+
+    # Start the Tkinter main loop
+    root.mainloop()
\ No newline at end of file
@@ -1,16 +1,257 @@
 import tkinter as tk
-from tkinter import messagebox, ttk
-import networkx as nx
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from tkinter import messagebox, ttk, filedialog
+from array import array
+from concurrent.futures import Future
+from contextlib import contextmanager
+from itertools import accumulate, islice
+import argparse
+import re
+import sys
+import threading
+
+from lazyimport import LazyModule
+import graphfile
+
+# Heavy modules load on first use: the window appears before matplotlib is
+# imported, and the headless command line never imports networkx or matplotlib
+nx = LazyModule("networkx")
+np = LazyModule("numpy")
+mfigure = LazyModule("matplotlib.figure")
+backend_tkagg = LazyModule("matplotlib.backends.backend_tkagg")
+mcollections = LazyModule("matplotlib.collections")
+mcolors = LazyModule("matplotlib.colors")
+mstengine = LazyModule("mstengine")
+mststream = LazyModule("mststream")
+
+# Native Borůvka switches to the multi-process engine from this many edges
+PARALLEL_BORUVKA_EDGES = 1000000
+
+# Bulk imports add edges to the graph in batches of this size
+IMPORT_BATCH_EDGES = 10000
+
+SEPARATORS = re.compile(r"[\s,;]+")
+
+def parse_edge_lines(lines):
+    """Yield (u, v, weight) from "u v [weight]" lines; v is None for a bare node.
+
+    Fields are separated by whitespace, commas or semicolons; empty trailing
+    fields (as in "a,b,") are ignored. Blank lines and lines starting with #
+    are skipped, and so is a header: a first line whose weight field is not a
+    number or whose node fields are column names (graphfile.HEADER_NAMES).
+    A missing weight counts as 1.
+    """
+    for line_number, line in enumerate(lines, 1):
+        fields = SEPARATORS.split(line.strip())
+        while len(fields) > 1 and not fields[-1]:
+            fields.pop()
+        if not fields[0] or fields[0].startswith("#"):
+            continue
+        if line_number == 1 and graphfile.is_header_row(fields):
+            continue
+        if len(fields) == 1:
+            yield fields[0], None, None
+            continue
+        try:
+            weight = float(fields[2]) if len(fields) > 2 else 1.0
+        except ValueError:
+            if line_number == 1:
+                continue
+            raise ValueError(f"line {line_number}: invalid edge cost {fields[2]!r}") from None
+        yield fields[0], fields[1], weight
+
+def parse_adjacency_lines(lines):
+    """Yield (u, v, weight) from "u v1[:w1] v2[:w2] ..." lines; v is None for a bare node."""
+    for line_number, line in enumerate(lines, 1):
+        fields = SEPARATORS.split(line.strip())
+        if not fields[0] or fields[0].startswith("#"):
+            continue
+        node = fields[0].rstrip(":")
+        yield node, None, None
+        for field in fields[1:]:
+            if not field:
+                continue
+            neighbor, _, weight = field.partition(":")
+            try:
+                yield node, neighbor, float(weight) if weight else 1.0
+            except ValueError:
+                raise ValueError(f"line {line_number}: invalid edge cost {weight!r}") from None
+
+IMPORT_FORMATS = {"Edge list": parse_edge_lines, "Adjacency list": parse_adjacency_lines}
+
+# Layouts of graphs with more nodes than this are computed off the Tk thread
+BACKGROUND_LAYOUT_NODES = 500
+# How often the Tk thread checks on background work, in milliseconds
+JOB_POLL_MS = 50
+
+def compute_layout(graph, previous_pos, previous_isolated, extent):
+    """Node positions for graph, reusing a previous layout where possible.
+
+    Nodes that already have a position and an edge stay where they are. New
+    nodes, and nodes that were isolated when last placed, start next to their
+    placed neighbours and are relaxed by a spring layout that keeps the rest
+    fixed. Returns (pos, extent, isolated nodes). Pure, so it can run on a
+    worker thread.
+    """
+    fixed = [node for node in graph.nodes if node in previous_pos and node not in previous_isolated]
+    if not fixed:
+        pos = nx.spring_layout(graph, seed=42) if len(graph) else {}
+        # spring_layout rescales into [-1, 1]; incremental layouts stay inside it
+        extent = (np.full(2, -1.1), np.full(2, 1.1))
+    else:
+        pos = {node: previous_pos[node] for node in fixed}
+        free = [node for node in graph.nodes if node not in pos]
+        if free:
+            rng = np.random.default_rng(42)
+            anchor = np.mean(list(pos.values()), axis=0)
+            for node in free:
+                placed = [pos[n] for n in graph.neighbors(node) if n in pos]
+                center = np.mean(placed, axis=0) if placed else anchor
+                pos[node] = center + rng.normal(scale=0.05, size=2)
+            pos = nx.spring_layout(graph, pos=pos, fixed=fixed, seed=42, iterations=30)
+            # Without rescaling, repulsion can push free nodes far out; keep
+            # them within the area of the last full layout
+            low, high = extent
+            for node in free:
+                clipped = np.clip(pos[node], low, high)
+                if (clipped != pos[node]).any():
+                    # Pull inwards at random so clipped nodes don't share a spot
+                    clipped = clipped + rng.uniform(0, 0.1, size=2) * np.sign(-clipped)
+                pos[node] = clipped
+    return pos, extent, {node for node in graph.nodes if graph.degree(node) == 0}
+
+def minimum_spanning_edges(graph, algorithm, backend="native", edge_arrays=None, check=None):
+    """(u, v, data) for every MST edge of graph in selection order.
+
+    edge_arrays is graph in mstengine.from_networkx form, if already known.
+    check, if given, is called periodically and may raise to abandon the run.
+    """
+    if backend == "networkx":
+        edges = []
+        for edge in nx.minimum_spanning_edges(graph, algorithm=algorithm, data=True):
+            if check is not None and not len(edges) % 4096:
+                check()
+            edges.append(edge)
+        return edges
+    nodes, u, v, w = edge_arrays or mstengine.from_networkx(graph)
+    if algorithm == 'boruvka' and len(u) >= PARALLEL_BORUVKA_EDGES:
+        algorithm = 'parallel-boruvka'
+    options = {} if check is None else {"check": check}
+    chosen = mstengine.minimum_spanning_forest(len(nodes), u, v, w, algorithm, **options)
+    return [(nodes[a], nodes[b], {'weight': cost}) for a, b, cost in zip(u[chosen].tolist(), v[chosen].tolist(), w[chosen].tolist())]
+
+class MSTResult:
+    """One MST run: edges in selection order, the total cost and the running
+    total after each step (what animate_mst shows)."""
+
+    __slots__ = ("algorithm", "edges", "total_cost", "cumulative_costs")
+
+    def __init__(self, algorithm, edges):
+        self.algorithm = algorithm
+        self.edges = edges
+        self.cumulative_costs = list(accumulate(d['weight'] for _, _, d in edges))
+        self.total_cost = self.cumulative_costs[-1] if edges else 0
+
+class JobCancelled(Exception):
+    pass
+
+class Job:
+    """Graph work run on a worker thread of GraphApp.
+
+    work(job) runs on the worker and must not touch Tk or matplotlib; it
+    reports progress through job.stage and calls job.check() between steps,
+    and passes it into long loops, so a cancelled job stops early. done(result)
+    then runs on the Tk thread. A newer job with the same key replaces a
+    pending one and cancels a running one, so rapid repeated requests collapse
+    into the last one. A cancelled job is not waited for: the next one starts
+    at once and the cancelled thread's result is dropped.
+    """
+
+    def __init__(self, key, stage, graph, work, done):
+        self.key = key
+        self.stage = stage
+        self.graph = graph
+        self.work = work
+        self.done = done
+        self.future = None
+        self.cancelled = threading.Event()
+
+    def check(self):
+        if self.cancelled.is_set():
+            raise JobCancelled()
+
+    def start(self):
+        # A daemon thread rather than an executor worker: those are joined at
+        # interpreter exit, so closing the window mid-job would keep the process
+        # alive until the job finished
+        self.future = Future()
+        threading.Thread(target=self.run, daemon=True).start()
+
+    def run(self):
+        self.future.set_running_or_notify_cancel()
+        try:
+            result = self.work(self)
+        except BaseException as e:
+            self.future.set_exception(e)
+        else:
+            self.future.set_result(result)
 
 class GraphApp:
     def __init__(self, master):
         self.master = master
         self.master.title("Graph Visualization with MST Algorithms")
         self.graph = nx.Graph()
-        self.mst_edges = []
+        self.mst_edges = set()
         self.mst_nodes = set()
+        # Once an MST has been computed it is kept current as edges are added;
+        # mst_shown is set while the finished tree is on screen
+        self.dynamic_mst = None
+        self.mst_shown = False
+        # after() id of the next animation step, while an animation runs
+        self.animation = None
+
+        # MST results for the current graph_version, keyed by (algorithm, backend).
+        # Every graph edit bumps graph_version, which empties the cache on next use
+        self.mst_cache = {}
+        self.mst_cache_version = -1
+
+        # Heavy graph work runs on a worker thread, one job at a time; results
+        # come back through master.after polling (see submit_job). Jobs read
+        # self.graph from the worker, so edits made while one holds it go to a
+        # copy (graph_for_edit)
+        self.job = None
+        # Cancelled jobs whose threads may still be reading their graph
+        self.abandoned_jobs = []
+        self.pending_jobs = {}
+
+        # Bumped on every structural change to self.graph; the layout cache
+        # remembers which version its positions belong to
+        self.graph_version = 0
+        self.layout_pos = {}
+        self.layout_version = -1
+        self.layout_isolated_nodes = set()
+        self.layout_extent = None  # Set by the first full layout
+
+        # NumPy edge arrays for the native MST backend, rebuilt per graph version
+        self.edge_arrays = None
+        self.edge_arrays_version = -1
+
+        # visualize_graph only records a pending redraw inside suspend_redraw()
+        self.redraw_suspended = 0
+        self.redraw_pending = None
+
+        # Level of detail. Labels are dropped above these sizes, and above
+        # lod_edge_limit edges the graph becomes a thin, optionally rasterised
+        # background with the MST drawn as an overlay layer on top
+        self.node_label_limit = 200
+        self.edge_label_limit = 300
+        self.lod_edge_limit = 1000
+        self.rasterize_background = True
+        self.lod = False
+
+        # Persistent artists, rebuilt only when the graph changes (see build_artists)
+        self.artists_version = -1
+        self.colors_dirty = False
+        self.background = None
 
         # Main Frame for left-side controls and right-side graph
         main_frame = tk.Frame(master)
@@ -24,13 +265,8 @@ class GraphApp:
         self.graph_frame = tk.Frame(main_frame)
         self.graph_frame.pack(side="right", expand=True, fill="both")
 
-        # Create a Matplotlib figure for graph visualization
-        self.fig, self.ax = plt.subplots(figsize=(8, 6))
-        self.algorithm_status_text = self.fig.text(0.5, 0.95, "No algorithm run yet.", ha='center', fontsize=12, color='black')
-
-        # Embed Matplotlib figure into Tkinter
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.graph_frame)
-        self.canvas.get_tk_widget().pack(expand=True, fill="both")
+        # The Matplotlib figure is built once the controls are on screen (build_figure)
+        self.fig = None
 
         # Node Input
         self.node_frame = ttk.LabelFrame(self.controls_frame, text="Node Input", padding=(10, 10))
@@ -74,6 +310,10 @@ class GraphApp:
         self.algorithm_frame = ttk.LabelFrame(self.controls_frame, text="MST Greedy Algorithms", padding=(10, 10))
         self.algorithm_frame.pack(fill="x", pady=(0, 10))
 
+        self.mst_backend = tk.StringVar(value="native")
+        ttk.Radiobutton(self.algorithm_frame, text="Native (NumPy)", variable=self.mst_backend, value="native").pack(anchor='w')
+        ttk.Radiobutton(self.algorithm_frame, text="NetworkX", variable=self.mst_backend, value="networkx").pack(anchor='w')
+
         self.run_kruskal_button = ttk.Button(self.algorithm_frame, text="Run Kruskal's Algorithm", command=self.run_kruskal)
         self.run_kruskal_button.pack(pady=(5, 0))
 
@@ -83,18 +323,143 @@ class GraphApp:
         self.run_boruvka_button = ttk.Button(self.algorithm_frame, text="Run Borůvka's Algorithm", command=self.run_boruvka)
         self.run_boruvka_button.pack(pady=(5, 0))
 
+        # Without animation a cached tree from any algorithm is shown at once
+        self.animate_runs = tk.BooleanVar(value=True)
+        ttk.Checkbutton(self.algorithm_frame, text="Animate", variable=self.animate_runs).pack(anchor='w', pady=(5, 0))
+
+        # Graph Files
+        self.file_frame = ttk.LabelFrame(self.controls_frame, text="Graph File", padding=(10, 10))
+        self.file_frame.pack(fill="x", pady=(0, 10))
+
+        self.open_button = ttk.Button(self.file_frame, text="Open Graph...", command=self.open_graph)
+        self.open_button.pack(pady=(5, 0))
+
+        self.save_button = ttk.Button(self.file_frame, text="Save Graph...", command=self.save_graph)
+        self.save_button.pack(pady=(5, 0))
+
+        # Bulk Import
+        self.import_frame = ttk.LabelFrame(self.controls_frame, text="Bulk Import", padding=(10, 10))
+        self.import_frame.pack(fill="x", pady=(0, 10))
+
+        self.import_format = tk.StringVar(value="Edge list")
+        for name in IMPORT_FORMATS:
+            ttk.Radiobutton(self.import_frame, text=name, variable=self.import_format, value=name).pack(anchor='w')
+
+        self.import_file_button = ttk.Button(self.import_frame, text="Import File...", command=self.import_file)
+        self.import_file_button.pack(pady=(5, 0))
+
+        self.paste_button = ttk.Button(self.import_frame, text="Paste Edges...", command=self.open_paste_dialog)
+        self.paste_button.pack(pady=(5, 0))
+
+        # Background Work
+        self.work_frame = ttk.LabelFrame(self.controls_frame, text="Background Work", padding=(10, 10))
+        self.work_frame.pack(fill="x", pady=(0, 10))
+
+        self.work_label = ttk.Label(self.work_frame, text="Idle")
+        self.work_label.pack(fill="x")
+
+        self.progress = ttk.Progressbar(self.work_frame, mode="indeterminate")
+        self.progress.pack(fill="x", pady=(5, 0))
+
+        self.cancel_button = ttk.Button(self.work_frame, text="Cancel", command=self.cancel_jobs)
+        self.cancel_button.pack(pady=(5, 0))
+
         # Clear Graph
         self.clear_button = ttk.Button(self.controls_frame, text="Clear Graph", command=self.clear_graph)
         self.clear_button.pack(pady=(10, 0))
 
-        # Initial graph visualization
-        self.visualize_graph()
+        self.master.protocol("WM_DELETE_WINDOW", self.close)
+
+        # Initial graph visualization, after the window has been drawn
+        self.master.after_idle(self.visualize_graph)
+
+    def build_figure(self):
+        # Deferred from __init__ so matplotlib's import doesn't delay the window
+        if self.fig is not None:
+            return
+        # Create a Matplotlib figure for graph visualization
+        self.fig = mfigure.Figure(figsize=(8, 6))
+        self.ax = self.fig.add_subplot()
+        self.algorithm_status_text = self.fig.text(0.5, 0.95, "No algorithm run yet.", ha='center', fontsize=12, color='black')
+
+        # Embed Matplotlib figure into Tkinter
+        self.canvas = backend_tkagg.FigureCanvasTkAgg(self.fig, master=self.graph_frame)
+        self.canvas.get_tk_widget().pack(expand=True, fill="both")
+        self.canvas.mpl_connect("draw_event", self.on_draw)
+
+    def close(self):
+        # A running job's daemon thread is abandoned, not waited for
+        self.cancel_jobs()
+        self.master.destroy()
+
+    def submit_job(self, job):
+        if self.job is not None and self.job.key == job.key:
+            self.abandon_job()
+        self.pending_jobs.pop(job.key, None)
+        self.pending_jobs[job.key] = job
+        self.start_next_job()
+
+    def abandon_job(self):
+        # Cancel the running job and stop waiting for it; its thread exits at
+        # its next job.check() and whatever it returns is ignored
+        self.job.cancelled.set()
+        self.abandoned_jobs = [job for job in self.abandoned_jobs if not job.future.done()]
+        self.abandoned_jobs.append(self.job)
+        self.job = None
+
+    def start_next_job(self):
+        if self.job is not None:
+            return  # A done callback already started one
+        if not self.pending_jobs:
+            self.progress.stop()
+            return
+        key = next(iter(self.pending_jobs))
+        self.job = job = self.pending_jobs.pop(key)
+        job.start()
+        self.work_label.config(text=job.stage)
+        self.progress.start(10)
+        self.master.after(JOB_POLL_MS, self.poll_job, job)
+
+    def poll_job(self, job):
+        if job is not self.job:
+            return  # Abandoned; the job that replaced it has its own poll
+        if not job.future.done():
+            self.work_label.config(text=job.stage)
+            self.master.after(JOB_POLL_MS, self.poll_job, job)
+            return
+        self.job = None
+        try:
+            if not job.cancelled.is_set():
+                self.work_label.config(text="Idle")
+                job.done(job.future.result())
+        except JobCancelled:
+            pass
+        except Exception as e:
+            self.work_label.config(text="Failed")
+            messagebox.showerror("Error", f"{job.stage} failed: {e}")
+        finally:
+            self.start_next_job()
+
+    def cancel_jobs(self):
+        self.pending_jobs.clear()
+        if self.job is not None:
+            self.abandon_job()
+            self.work_label.config(text="Cancelled")
+        self.progress.stop()
+
+    def graph_for_edit(self):
+        # Copy-on-write: never mutate a graph a background job may be reading
+        jobs = list(self.pending_jobs.values()) + self.abandoned_jobs + ([self.job] if self.job is not None else [])
+        if any(job.graph is self.graph for job in jobs):
+            self.graph = self.graph.copy()
+        return self.graph
 
     def add_node(self):
         node_id = self.node_entry.get()
         if node_id:
             if node_id not in self.graph.nodes:
-                self.graph.add_node(node_id)
+                self.graph_for_edit().add_node(node_id)
+                self.graph_version += 1
                 self.visualize_graph()
             else:
                 messagebox.showwarning("Warning", f"Node '{node_id}' already exists.")
@@ -109,8 +474,14 @@ class GraphApp:
             try:
                 weight = float(weight)
                 if source in self.graph.nodes and target in self.graph.nodes:
-                    self.graph.add_edge(source, target, weight=weight)
-                    self.visualize_graph()
+                    self.graph_for_edit().add_edge(source, target, weight=weight)
+                    self.graph_version += 1
+                    if self.dynamic_mst is not None:
+                        self.dynamic_mst.add_edge(source, target, weight)
+                    if self.mst_shown:
+                        self.show_dynamic_mst()
+                    else:
+                        self.visualize_graph()
                 else:
                     messagebox.showwarning("Warning", "Both nodes must exist.")
             except ValueError:
@@ -120,88 +491,467 @@ class GraphApp:
             self.weight_entry.delete(0, tk.END)
 
     def run_kruskal(self):
-        self.reset_graph_colors()
-        if not self.graph.edges:
-            messagebox.showwarning("Warning", "No edges in the graph.")
-            return
-        mst_edges = list(nx.minimum_spanning_edges(self.graph, algorithm='kruskal', data=True))
-        self.animate_mst(mst_edges, "Kruskal's Algorithm")
+        self.run_mst('kruskal', "Kruskal's Algorithm")
 
     def run_prim(self):
-        self.reset_graph_colors()
-        if not self.graph.edges:
-            messagebox.showwarning("Warning", "No edges in the graph.")
-            return
-        mst_edges = list(nx.minimum_spanning_edges(self.graph, algorithm='prim', data=True))
-        self.animate_mst(mst_edges, "Prim's Algorithm")
+        self.run_mst('prim', "Prim's Algorithm")
 
     def run_boruvka(self):
+        self.run_mst('boruvka', "Borůvka's Algorithm")
+
+    def cached_mst(self, algorithm=None, backend=None):
+        """The cached MSTResult for the current graph, or None.
+
+        With no algorithm, any algorithm's result will do: they are all
+        minimum spanning forests, so the total cost is the same, and with
+        distinct weights (or the native backend's tie-breaking) so is the tree.
+        """
+        if self.mst_cache_version != self.graph_version:
+            self.mst_cache.clear()
+            self.mst_cache_version = self.graph_version
+        if algorithm is not None:
+            return self.mst_cache.get((algorithm, backend))
+        return next(iter(self.mst_cache.values()), None)
+
+    def run_mst(self, algorithm, algorithm_name):
+        self.build_figure()
         self.reset_graph_colors()
         if not self.graph.edges:
             messagebox.showwarning("Warning", "No edges in the graph.")
             return
-        # Borůvka's algorithm implementation
-        mst_edges = list(nx.minimum_spanning_edges(self.graph, algorithm='boruvka', data=True))
-        self.animate_mst(mst_edges, "Borůvka's Algorithm")
+        graph, version, backend = self.graph, self.graph_version, self.mst_backend.get()
+        animate = self.animate_runs.get()
+        cached = self.cached_mst(algorithm, backend) if animate else self.cached_mst()
+        if cached is not None and self.dynamic_mst is not None:
+            self.show_mst(cached, algorithm_name, animate)
+            return
+
+        layout_state = (self.layout_pos, self.layout_isolated_nodes, self.layout_extent)
+        layout_stale = self.layout_version != version
+        edge_arrays = self.edge_arrays if self.edge_arrays_version == version else None
+
+        def work(job):
+            layout = None
+            if layout_stale:
+                job.stage = "Computing layout..."
+                layout = compute_layout(graph, *layout_state)
+                job.check()
+            arrays = edge_arrays
+            result = cached
+            if result is None:
+                if backend == "native" and arrays is None:
+                    job.stage = "Preparing edge arrays..."
+                    arrays = mstengine.from_networkx(graph, check=job.check)
+                    job.check()
+                job.stage = f"Running {algorithm_name}..."
+                result = MSTResult(algorithm, minimum_spanning_edges(graph, algorithm, backend, arrays, job.check))
+                job.check()
+            job.stage = "Indexing the MST..."
+            tree = {frozenset((u, v)) for u, v, _ in result.edges}
+            dynamic_mst = mstengine.DynamicMST.from_forest(
+                ((u, v, d['weight']) for u, v, d in result.edges),
+                ((u, v, w) for u, v, w in graph.edges(data='weight') if frozenset((u, v)) not in tree),
+                check=job.check)
+            return layout, arrays, result, dynamic_mst
+
+        def done(job_result):
+            if version != self.graph_version:
+                # The graph changed while this ran; compute it again for the current one
+                self.run_mst(algorithm, algorithm_name)
+                return
+            layout, arrays, result, dynamic_mst = job_result
+            if layout is not None:
+                self.store_layout(version, layout)
+            if arrays is not None:
+                self.edge_arrays, self.edge_arrays_version = arrays, version
+            self.cached_mst()  # Drops entries for older versions
+            self.mst_cache[(result.algorithm, backend)] = result
+            self.dynamic_mst = dynamic_mst
+            self.show_mst(result, algorithm_name, animate)
+
+        self.algorithm_status_text.set_text(f"{algorithm_name} running...")
+        self.canvas.draw_idle()
+        # All algorithms share one key, so clicking several in a row runs only the last
+        self.submit_job(Job("mst", f"Running {algorithm_name}...", graph, work, done))
+
+    def show_mst(self, result, algorithm_name, animate=True):
+        self.stop_animation()
+        if animate:
+            self.animate_mst(result, algorithm_name)
+            return
+        self.mst_edges = {(u, v) for u, v, _ in result.edges}
+        self.mst_nodes = {node for edge in self.mst_edges for node in edge}
+        self.mst_shown = True
+        self.algorithm_status_text.set_text(f"{algorithm_name} Completed")
+        self.visualize_graph(result.total_cost)
+
+    def show_dynamic_mst(self):
+        self.stop_animation()
+        self.mst_edges = {(u, v) for u, v, _ in self.dynamic_mst.edges()}
+        self.mst_nodes = {node for edge in self.mst_edges for node in edge}
+        self.algorithm_status_text.set_text("MST updated")
+        self.visualize_graph(self.dynamic_mst.total_weight)
 
     def reset_graph_colors(self):
         """Reset the MST edges and nodes to their original colors."""
+        self.stop_animation()
         self.mst_edges.clear()
         self.mst_nodes.clear()
+        self.mst_shown = False
+
+    def stop_animation(self):
+        if self.animation is not None:
+            self.master.after_cancel(self.animation)
+            self.animation = None
 
-    def animate_mst(self, mst_edges, algorithm_name):
+    def animate_mst(self, result, algorithm_name):
         self.algorithm_status_text.set_text(f"{algorithm_name}")
-        total_cost = 0
+        self.visualize_graph()
 
         def animate_step(index):
-            if index < len(mst_edges):
-                u, v, d = mst_edges[index]
-                self.mst_edges.append((u, v))
+            self.animation = None
+            if index < len(result.edges):
+                u, v, _ = result.edges[index]
+                self.mst_edges.add((u, v))
                 self.mst_nodes.update([u, v])
-                total_cost = sum(d['weight'] for _, _, d in mst_edges[:index + 1])
-                self.visualize_graph(total_cost)
-                self.master.after(1000, lambda: animate_step(index + 1))
+                self.draw_mst_step(u, v, result.cumulative_costs[index])
+                self.animation = self.master.after(1000, lambda: animate_step(index + 1))
             else:
                 self.algorithm_status_text.set_text(f"{algorithm_name} Completed")
+                self.mst_shown = True
+                self.visualize_graph(result.total_cost)
 
         animate_step(0)
 
-    def visualize_graph(self, total_cost=None):
+    def layout(self):
+        """Node positions for the current graph, recomputed only when it changes."""
+        if self.layout_version != self.graph_version:
+            self.store_layout(self.graph_version, compute_layout(
+                self.graph, self.layout_pos, self.layout_isolated_nodes, self.layout_extent))
+        return self.layout_pos
+
+    def store_layout(self, version, layout):
+        self.layout_pos, self.layout_extent, self.layout_isolated_nodes = layout
+        self.layout_version = version
+
+    def layout_in_background(self, total_cost):
+        graph, version = self.graph, self.graph_version
+        layout_state = (self.layout_pos, self.layout_isolated_nodes, self.layout_extent)
+
+        def done(layout):
+            if version == self.graph_version:
+                self.store_layout(version, layout)
+            self.visualize_graph(total_cost)
+
+        self.submit_job(Job("layout", "Computing layout...", graph,
+                            lambda job: compute_layout(graph, *layout_state), done))
+
+    def build_artists(self, pos):
+        """Create every artist for the current graph once.
+
+        Later redraws and animation frames only recolour them through
+        node_index/edge_index, which map a node or an edge (in either
+        orientation) to its row in the colour arrays. In level-of-detail mode
+        the background is never recoloured; the MST overlay collections are
+        updated instead.
+        """
         self.ax.clear()
-        pos = nx.spring_layout(self.graph, seed=42)
+        nodes = list(self.graph.nodes)
+        # Self-loops never belong to an MST, so they are drawn once and left alone
+        edges = [(u, v) for u, v in self.graph.edges() if u != v]
+        self.lod = len(edges) > self.lod_edge_limit
+        self.node_size = 12 if self.lod else 700
+        edge_width = 0.5 if self.lod else 2
+        self.node_base_color = mcolors.to_rgba('lightsteelblue' if self.lod else 'lightblue')
+        self.edge_base_color = mcolors.to_rgba('lightgray' if self.lod else 'black')
+
+        self.node_index = {node: i for i, node in enumerate(nodes)}
+        self.node_colors = np.tile(self.node_base_color, (len(nodes), 1))
+        self.node_artist = None
+        if nodes:
+            self.node_artist = nx.draw_networkx_nodes(self.graph, pos, nodelist=nodes, node_color=self.node_colors,
+                                                      ax=self.ax, node_size=self.node_size)
+
+        self.edge_index = {}
+        for i, (u, v) in enumerate(edges):
+            self.edge_index[(u, v)] = self.edge_index[(v, u)] = i
+        self.edge_colors = np.tile(self.edge_base_color, (len(edges), 1))
+        self.edge_artist = mcollections.LineCollection([(pos[u], pos[v]) for u, v in edges], colors=self.edge_colors,
+                                          linewidths=edge_width, zorder=1)
+        self.ax.add_collection(self.edge_artist)
+        loops = list(nx.selfloop_edges(self.graph))
+        if loops and not self.lod:
+            nx.draw_networkx_edges(self.graph, pos, edgelist=loops, ax=self.ax, width=2)
+
+        self.edge_label_artists = {}
+        if len(edges) <= self.edge_label_limit:
+            edge_labels = nx.get_edge_attributes(self.graph, 'weight')
+            self.edge_label_artists = nx.draw_networkx_edge_labels(self.graph, pos, edge_labels=edge_labels, ax=self.ax, font_color='black')
+        self.node_label_artists = {}
+        if len(nodes) <= self.node_label_limit:
+            self.node_label_artists = nx.draw_networkx_labels(self.graph, pos, ax=self.ax, font_size=10, font_color='black')
+
+        if self.lod:
+            if self.rasterize_background:
+                self.edge_artist.set_rasterized(True)
+                if self.node_artist is not None:
+                    self.node_artist.set_rasterized(True)
+            self.mst_edge_overlay = mcollections.LineCollection([], colors='green', linewidths=1, zorder=3)
+            self.ax.add_collection(self.mst_edge_overlay)
+            self.mst_node_overlay = self.ax.scatter([], [], s=self.node_size, c='green', zorder=4)
+
+        # Animated artists are left out of full draws and blitted on top instead
+        step_color = 'green' if self.lod else 'lightgreen'
+        self.step_edge = self.ax.plot([], [], color=step_color, linewidth=1 if self.lod else 2, zorder=3, animated=True)[0]
+        self.step_nodes = self.ax.scatter([], [], s=self.node_size, c=step_color, zorder=4, animated=True)
+        self.cost_text = self.ax.text(0.5, 1.05, "", fontsize=12, ha='center', transform=self.ax.transAxes, animated=True)
+        self.ax.set_title("Graph Visualization")
+        self.ax.autoscale_view()
+        self.pos = pos
+        self.artists_version = self.graph_version
+
+    def apply_colors(self):
+        # Recolour everything from the MST sets, for full redraws
+        # MST entries no longer in the drawn graph are skipped
+        pos = self.pos
+        if self.lod:
+            self.mst_edge_overlay.set_segments([(pos[u], pos[v]) for u, v in self.mst_edges if u in pos and v in pos])
+            self.mst_node_overlay.set_offsets(
+                np.array([pos[node] for node in self.mst_nodes if node in pos]).reshape(-1, 2))
+            self.colors_dirty = False
+            return
+        self.node_colors[:] = self.node_base_color
+        self.edge_colors[:] = self.edge_base_color
+        for node in self.mst_nodes:
+            if node in self.node_index:
+                self.node_colors[self.node_index[node]] = mcolors.to_rgba('lightgreen')
+        for edge in self.mst_edges:
+            if edge in self.edge_index:
+                self.edge_colors[self.edge_index[edge]] = mcolors.to_rgba('lightgreen')
+        self.sync_colors()
+
+    def sync_colors(self):
+        if self.node_artist is not None:
+            self.node_artist.set_facecolor(self.node_colors)
+            self.node_artist.set_edgecolor(self.node_colors)
+        self.edge_artist.set_color(self.edge_colors)
+        self.colors_dirty = False
+
+    def on_draw(self, event):
+        # A full draw happened (ours or a window resize): refresh the blit background
+        if self.artists_version < 0:
+            return
+        if self.colors_dirty:
+            self.apply_colors()
+            self.canvas.draw_idle()
+            return
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.ax.draw_artist(self.cost_text)
 
-        # Draw nodes
-        node_colors = ['lightgreen' if node in self.mst_nodes else 'lightblue' for node in self.graph.nodes]
-        nx.draw_networkx_nodes(self.graph, pos, node_color=node_colors, ax=self.ax, node_size=700)
+    def draw_mst_step(self, u, v, total_cost):
+        """Colour one MST edge with a blit: cost independent of the graph size."""
+        self.colors_dirty = True  # Applied from the MST sets at the next full draw
+        if u not in self.pos or v not in self.pos:
+            return
+        if self.background is None:
+            self.visualize_graph(total_cost)
+            return
 
-        # Draw edges
-        edges = self.graph.edges()
-        edge_colors = ['lightgreen' if (u, v) in self.mst_edges or (v, u) in self.mst_edges else 'black' for u, v in edges]
-        nx.draw_networkx_edges(self.graph, pos, edge_color=edge_colors, ax=self.ax, width=2)
+        (x1, y1), (x2, y2) = self.pos[u], self.pos[v]
+        self.canvas.restore_region(self.background)
+        self.step_edge.set_data([x1, x2], [y1, y2])
+        self.step_nodes.set_offsets([(x1, y1), (x2, y2)])
+        self.ax.draw_artist(self.step_edge)
+        self.ax.draw_artist(self.step_nodes)
+        for artist in (self.edge_label_artists.get((u, v)) or self.edge_label_artists.get((v, u)),
+                       self.node_label_artists.get(u), self.node_label_artists.get(v)):
+            if artist is not None:
+                self.ax.draw_artist(artist)
+        # The green edge becomes part of the background; the cost text does not
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.cost_text.set_text(f"Total Cost of MST: {total_cost}")
+        self.ax.draw_artist(self.cost_text)
+        self.canvas.blit(self.fig.bbox)
+
+    @contextmanager
+    def suspend_redraw(self):
+        """Batch graph edits: visualize_graph calls inside only mark a redraw
+        as pending, and the outermost context runs it once on exit."""
+        self.redraw_suspended += 1
+        try:
+            yield
+        finally:
+            self.redraw_suspended -= 1
+            if not self.redraw_suspended and self.redraw_pending is not None:
+                total_cost = self.redraw_pending[0]
+                self.redraw_pending = None
+                self.visualize_graph(total_cost)
 
-        # Draw edge labels
-        edge_labels = nx.get_edge_attributes(self.graph, 'weight')
-        nx.draw_networkx_edge_labels(self.graph, pos, edge_labels=edge_labels, ax=self.ax, font_color='black')
+    def visualize_graph(self, total_cost=None):
+        if self.redraw_suspended:
+            self.redraw_pending = (total_cost,)
+            return
+        self.build_figure()
+        if self.layout_version != self.graph_version and len(self.graph) > BACKGROUND_LAYOUT_NODES:
+            # The current figure stays up until the new layout arrives
+            self.layout_in_background(total_cost)
+            return
+        pos = self.layout()
+        if self.artists_version != self.graph_version:
+            self.build_artists(pos)
+        self.apply_colors()
+        self.cost_text.set_text("" if total_cost is None else f"Total Cost of MST: {total_cost}")
+        self.canvas.draw()
 
-        # Total cost display
-        if total_cost is not None:
-            self.ax.text(0.5, 1.05, f"Total Cost of MST: {total_cost}", fontsize=12, ha='center', transform=self.ax.transAxes)
+    def import_lines(self, lines, parse):
+        """Stream parsed lines into the graph in batches; returns (nodes, edges) added."""
+        nodes_before = self.graph.number_of_nodes()
+        edges_before = self.graph.number_of_edges()
+        records = parse(lines)
+        with self.suspend_redraw():
+            try:
+                while True:
+                    batch = list(islice(records, IMPORT_BATCH_EDGES))
+                    if not batch:
+                        break
+                    graph = self.graph_for_edit()
+                    graph.add_nodes_from(u for u, v, _ in batch if v is None)
+                    graph.add_weighted_edges_from((u, v, w) for u, v, w in batch if v is not None)
+            finally:
+                # Whatever made it in before an error stays, and is drawn once
+                self.graph_version += 1
+                self.dynamic_mst = None
+                self.reset_graph_colors()
+                self.visualize_graph()
+        return (self.graph.number_of_nodes() - nodes_before, self.graph.number_of_edges() - edges_before)
+
+    def run_import(self, lines, source):
+        try:
+            nodes, edges = self.import_lines(lines, IMPORT_FORMATS[self.import_format.get()])
+        except ValueError as e:
+            messagebox.showerror("Error", f"Could not import {source}: {e}")
+            return False
+        self.algorithm_status_text.set_text(f"Imported {nodes} nodes and {edges} edges.")
+        self.canvas.draw_idle()
+        return True
+
+    def import_file(self):
+        path = filedialog.askopenfilename(filetypes=[("Text files", "*.txt *.csv *.tsv *.edges *.adj"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            with open(path, newline="") as f:
+                self.run_import(f, path)
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not open {path}: {e}")
+
+    def open_paste_dialog(self):
+        dialog = tk.Toplevel(self.master)
+        dialog.title(f"Paste {self.import_format.get()}")
+        text = tk.Text(dialog, width=60, height=20)
+        text.pack(expand=True, fill="both", padx=10, pady=10)
+
+        def do_import():
+            if self.run_import(text.get("1.0", tk.END).splitlines(), "pasted text"):
+                dialog.destroy()
+
+        ttk.Button(dialog, text="Import", command=do_import).pack(pady=(0, 10))
+
+    def open_graph(self):
+        path = filedialog.askopenfilename(filetypes=[("Graph files", "*.graph"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            graph_file = graphfile.read_graph(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Could not open graph: {e}")
+            return
+        # Directed graphs (e.g. saved from the shortest path solver) are read as undirected
+        labels = list(graph_file.labels)
+        graph = nx.Graph()
+        graph.add_nodes_from(labels)
+        graph.add_weighted_edges_from((labels[u], labels[v], float(cost)) for u, v, cost in graph_file.edges())
+        self.replace_graph(graph)
+        # Use the stored coordinates as the layout unless the file has none
+        if any(graph_file.xs) or any(graph_file.ys):
+            self.layout_pos = {label: np.array((x, y)) for label, x, y in zip(labels, graph_file.xs, graph_file.ys)}
+            self.layout_version = self.graph_version
+            corners = np.array(list(self.layout_pos.values()))
+            low, high = corners.min(axis=0), corners.max(axis=0)
+            margin = 0.05 * np.maximum(high - low, 1e-9)
+            self.layout_extent = (low - margin, high + margin)
+        self.reset_graph_colors()
+        self.visualize_graph()
 
-        # Draw node labels
-        nx.draw_networkx_labels(self.graph, pos, ax=self.ax, font_size=10, font_color='black')
-        self.ax.set_title("Graph Visualization")
-        self.canvas.draw()
+    def save_graph(self):
+        path = filedialog.asksaveasfilename(defaultextension=".graph", filetypes=[("Graph files", "*.graph")])
+        if not path:
+            return
+        nodes = list(self.graph.nodes)
+        index = {node: i for i, node in enumerate(nodes)}
+        # Each undirected edge is stored once, under its lower-indexed endpoint
+        adjacency = [[] for _ in nodes]
+        for u, v, weight in self.graph.edges(data='weight', default=1):
+            if index[u] > index[v]:
+                u, v = v, u
+            adjacency[index[u]].append((index[v], weight))
+        offsets, targets, costs = array('q', [0]), array('q'), array('d')
+        for neighbors in adjacency:
+            for v, weight in neighbors:
+                targets.append(v)
+                costs.append(weight)
+            offsets.append(len(targets))
+        pos = self.layout()
+        xs = array('d', (pos[node][0] for node in nodes))
+        ys = array('d', (pos[node][1] for node in nodes))
+        try:
+            graphfile.write_graph(path, nodes, xs, ys, offsets, targets, costs, directed=False)
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not save graph: {e}")
+
+    def replace_graph(self, graph):
+        # A new graph, not an edit: nothing of the old layout may pin its nodes,
+        # even those whose names match old ones
+        self.graph = graph
+        self.graph_version += 1
+        self.dynamic_mst = None
+        self.layout_pos = {}
+        self.layout_version = -1
+        self.layout_isolated_nodes = set()
+        self.layout_extent = None
 
     def clear_graph(self):
-        self.graph.clear()
+        self.replace_graph(nx.Graph())
         self.reset_graph_colors()
         messagebox.showinfo("Graph Cleared", "The graph has been cleared.")
         self.visualize_graph()
 
-def main():
-    root = tk.Tk()
-    app = GraphApp(root)
-    root.mainloop()
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Graph Visualization with MST Algorithms. Without an edge list the GUI is started.")
+    parser.add_argument("edges", nargs="?", help="edge list (.csv, .tsv, .bin) to reduce to its minimum spanning forest out of core")
+    parser.add_argument("--format", choices=["csv", "tsv", "bin"], help="input format (default: from extension)")
+    parser.add_argument("-o", "--output", help="write the MST edges here instead of stdout")
+    parser.add_argument("--output-format", choices=["csv", "tsv", "bin"], help="output format (default: from extension, csv on stdout)")
+    parser.add_argument("--chunk-edges", type=int, default=1000000, help="edges sorted in memory per run file")
+    parser.add_argument("--tmpdir", help="directory for the sorted run files (default: system temp directory)")
+    args = parser.parse_args(argv)
+
+    if args.edges is None:
+        root = tk.Tk()
+        app = GraphApp(root)
+        root.mainloop()
+        return 0
+
+    output = args.output
+    if output is None:
+        output = sys.stdout.buffer if args.output_format == "bin" else sys.stdout
+    try:
+        edges, total = mststream.external_kruskal(args.edges, output, args.format, args.output_format,
+                                                  args.chunk_edges, args.tmpdir)
+    except (OSError, ValueError) as e:
+        parser.error(f"could not compute the MST of {args.edges}: {e}")
+    print(f"{edges} MST edges, total weight {total:g}", file=sys.stderr)
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
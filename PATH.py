@@ -1,40 +1,259 @@
 import tkinter as tk
-from tkinter import simpledialog, messagebox
-from collections import deque, defaultdict
+from tkinter import simpledialog, messagebox, filedialog
+from collections import deque, OrderedDict
+from itertools import count, islice
+from array import array
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+import argparse
+import csv
+import hashlib
+import heapq
+import math
+import os
+import struct
+import sys
 
-# Vertex and Edge classes remain unchanged
+import graphfile
+
+# Vertex and Edge use __slots__ so large graphs don't pay for a dict per object
 class Vertex:
+    __slots__ = ("label", "index", "edges", "is_source", "cost", "previous", "x", "y")
+
     def __init__(self, label, x, y):
         self.label = label
+        self.index = None  # Position in Graph.vertices, assigned by add_vertex
         self.edges = []
-        self.neighbors = []
         self.is_source = False
         self.cost = float('inf')
         self.previous = None
         self.x = x
         self.y = y
 
+    @property
+    def neighbors(self):
+        return [edge.to_vertex for edge in self.edges]
+
 class Edge:
+    __slots__ = ("from_vertex", "to_vertex", "cost")
+
     def __init__(self, from_vertex, to_vertex, cost=1):
         self.from_vertex = from_vertex
         self.to_vertex = to_vertex
         self.cost = cost
 
+class SpatialGrid:
+    """Uniform grid of vertices by coordinates, for hit-testing and viewport culling."""
+
+    def __init__(self, cell_size=40):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def _cell(self, x, y):
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def insert(self, vertex):
+        self.cells.setdefault(self._cell(vertex.x, vertex.y), []).append(vertex)
+
+    def query(self, x0, y0, x1, y1):
+        # Vertices with x0 <= x <= x1 and y0 <= y <= y1
+        cx0, cy0 = self._cell(x0, y0)
+        cx1, cy1 = self._cell(x1, y1)
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self.cells):
+            # Zoomed far out: cheaper to walk the occupied cells
+            cells = (cell for (cx, cy), cell in self.cells.items() if cx0 <= cx <= cx1 and cy0 <= cy <= cy1)
+        else:
+            cells = (self.cells.get((cx, cy)) for cx in range(cx0, cx1 + 1) for cy in range(cy0, cy1 + 1))
+        for cell in cells:
+            if cell:
+                for vertex in cell:
+                    if x0 <= vertex.x <= x1 and y0 <= vertex.y <= y1:
+                        yield vertex
+
+    def find(self, x, y, radius):
+        # The earliest added vertex whose square of half-size radius contains (x, y)
+        return min(self.query(x - radius, y - radius, x + radius, y + radius),
+                   key=lambda vertex: vertex.index, default=None)
+
 class Graph:
     def __init__(self):
         self.vertices = []
+        # Edge cost statistics, kept up to date by add_edge for Dial's algorithm
+        self.max_cost = 0
+        self.integer_costs = True
+        # Bumped on every structural change; cached snapshots and query results
+        # remember the version they were computed for
+        self.version = 0
+        self._compact = None
+        self._path_cache = OrderedDict()
+        self._path_cache_version = 0
+        self.path_cache_size = 32
+        self._hierarchy = None
+        self.spatial_index = SpatialGrid()
 
     def add_vertex(self, label, x, y):
         vertex = Vertex(label, x, y)
+        vertex.index = len(self.vertices)
         self.vertices.append(vertex)
+        self.spatial_index.insert(vertex)
+        self.version += 1
         return vertex
 
     def add_edge(self, from_vertex, to_vertex, cost=1):
         edge = Edge(from_vertex, to_vertex, cost)
+        if cost > self.max_cost:
+            self.max_cost = cost
+        if not isinstance(cost, int) or cost < 0:
+            self.integer_costs = False
         from_vertex.edges.append(edge)
-        from_vertex.neighbors.append(to_vertex)
+        self.version += 1
         return edge
 
+    def remove_edge(self, edge):
+        # max_cost/integer_costs stay as upper bounds, which Dial's still handles
+        edge.from_vertex.edges.remove(edge)
+        self.version += 1
+
+    def set_edge_cost(self, edge, cost):
+        edge.cost = cost
+        if cost > self.max_cost:
+            self.max_cost = cost
+        if not isinstance(cost, int) or cost < 0:
+            self.integer_costs = False
+        self.version += 1
+
+    @classmethod
+    def from_compact(cls, compact):
+        graph = cls()
+        vertices = [graph.add_vertex(label, x, y) for label, x, y in zip(compact.labels, compact.xs, compact.ys)]
+        offsets, targets, costs = compact.offsets, compact.targets, compact.costs
+        for u, vertex in enumerate(vertices):
+            for k in range(offsets[u], offsets[u + 1]):
+                graph.add_edge(vertex, vertices[targets[k]], costs[k])
+        return graph
+
+    def save(self, path):
+        self.freeze().save(path)
+
+    @classmethod
+    def load(cls, path):
+        return cls.from_compact(CompactGraph.load(path))
+
+    def freeze(self):
+        if self._compact is None or self._compact[0] != self.version:
+            self._compact = (self.version, CompactGraph.from_graph(self))
+        return self._compact[1]
+
+    def shortest_paths(self, source, engine="heap", **options):
+        # Non-mutating query: distances and predecessors live in the returned tree,
+        # not on the Vertex objects. Trees are cached per (source, engine, options)
+        # with LRU eviction and dropped as soon as the graph version changes.
+        if isinstance(source, Vertex):
+            source = source.index
+        if self._path_cache_version != self.version:
+            self._path_cache.clear()
+            self._path_cache_version = self.version
+
+        key = (source, engine, tuple(sorted(options.items())))
+        tree = self._path_cache.get(key)
+        if tree is not None:
+            self._path_cache.move_to_end(key)
+            return tree
+
+        compact = self.freeze()
+        dist, previous = ENGINES[engine](compact, source, **options)
+        tree = ShortestPathTree(compact, source, dist, previous)
+        self._path_cache[key] = tree
+        if len(self._path_cache) > self.path_cache_size:
+            self._path_cache.popitem(last=False)
+        return tree
+
+    def iter_batch_shortest_paths(self, sources="all", engine="heap", workers=None, **options):
+        # Runs one single-source query per source across a process pool and yields
+        # (source_index, distances) as each one finishes, in completion order.
+        # The frozen graph is sent once per worker through the pool initializer.
+        # Only about two tasks per worker are in flight, and a row is released
+        # once yielded, so memory stays O(workers * V) however many sources run.
+        if sources == "all":
+            sources = range(len(self.vertices))
+        sources = [source.index if isinstance(source, Vertex) else source for source in sources]
+        compact = self.freeze()
+
+        if workers == 1:
+            for source in sources:
+                dist, _ = ENGINES[engine](compact, source, **options)
+                yield source, array('d', dist)
+            return
+
+        window = 2 * (workers or os.cpu_count() or 1)
+        remaining = iter(sources)
+        with ProcessPoolExecutor(workers, initializer=_batch_worker_init, initargs=(compact, engine, options)) as pool:
+            in_flight = {pool.submit(_batch_worker_run, source) for source in islice(remaining, window)}
+            try:
+                while in_flight:
+                    finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    in_flight |= {pool.submit(_batch_worker_run, source) for source in islice(remaining, len(finished))}
+                    for future in finished:
+                        yield future.result()
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+    def distance_matrix(self, sources="all", engine="heap", workers=None, path=None, **options):
+        # Distance table with one row per source, filled as results stream in.
+        # With path set the matrix is a memory-mapped .npy file instead of living in RAM.
+        import numpy as np
+        if sources == "all":
+            sources = range(len(self.vertices))
+        sources = [source.index if isinstance(source, Vertex) else source for source in sources]
+        shape = (len(sources), len(self.vertices))
+        if path is None:
+            matrix = np.empty(shape)
+        else:
+            matrix = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=shape)
+        rows = {source: row for row, source in enumerate(sources)}
+        for source, dist in self.iter_batch_shortest_paths(sources, engine, workers, **options):
+            matrix[rows[source]] = np.frombuffer(dist, dtype=np.float64)
+        if path is not None:
+            matrix.flush()
+        return matrix
+
+    def shortest_path(self, source, target, method="astar"):
+        # Point-to-point query returning (cost, [Vertex, ...]); the search stops
+        # as soon as the target is settled instead of solving the whole graph
+        if isinstance(source, Vertex):
+            source = source.index
+        if isinstance(target, Vertex):
+            target = target.index
+        if method == "ch":
+            cost, path = self.contraction_hierarchy().query(source, target)
+        else:
+            cost, path = POINT_TO_POINT_ENGINES[method](self.freeze(), source, target)
+        return cost, [self.vertices[i] for i in path]
+
+    def contraction_hierarchy(self):
+        # Built once per graph version; repeated "ch" queries reuse it
+        if self._hierarchy is None or self._hierarchy.version != self.version:
+            self._hierarchy = ContractionHierarchy.build(self.freeze(), self.version)
+        return self._hierarchy
+
+    def load_contraction_hierarchy(self, path):
+        hierarchy = ContractionHierarchy.load(path)
+        if hierarchy.fingerprint != self.freeze().fingerprint():
+            raise ValueError(f"{path} was built for a different graph.")
+        # Same vertices, edges and costs, so it stands in for one built now
+        hierarchy.version = self.version
+        self._hierarchy = hierarchy
+        return hierarchy
+
+    def reset_costs(self, preset=None):
+        # Clears what the Vertex-mutating algorithms below left behind; preset maps
+        # vertices to starting costs, as entered in the GUI's "Set cost" mode
+        for vertex in self.vertices:
+            vertex.cost = float('inf')
+            vertex.previous = None
+        for vertex, cost in (preset or {}).items():
+            vertex.cost = cost
+
     def dijkstra(self, source):
         source.cost = 0
         unvisited = self.vertices.copy()
@@ -50,38 +269,1122 @@ class Graph:
                     neighbor.cost = new_cost
                     neighbor.previous = current_vertex
 
-        result = []
+        return self.format_results()
+
+    def dijkstra_heap(self, source):
+        # Lazy-deletion binary heap: O((V + E) log V) instead of the O(V^2) scan above.
+        # Stale entries are skipped when popped rather than removed from the heap.
+        # Every vertex with a finite cost is a start point, like in the scan above,
+        # so costs preset in "Set cost" mode behave the same in both engines.
+        source.cost = 0
+        tiebreak = count()
+        heap = [(vertex.cost, next(tiebreak), vertex) for vertex in self.vertices if vertex.cost != float('inf')]
+        heapq.heapify(heap)
+        visited = set()
+
+        while heap:
+            cost, _, current_vertex = heapq.heappop(heap)
+            if current_vertex in visited or cost > current_vertex.cost:
+                continue
+            visited.add(current_vertex)
+
+            for edge in current_vertex.edges:
+                neighbor = edge.to_vertex
+                new_cost = current_vertex.cost + edge.cost
+                if new_cost < neighbor.cost:
+                    neighbor.cost = new_cost
+                    neighbor.previous = current_vertex
+                    heapq.heappush(heap, (new_cost, next(tiebreak), neighbor))
+
+        return self.format_results()
+
+    def format_results(self):
+        return list(self.iter_results())
+
+    def iter_results(self):
         for vertex in self.vertices:
-            result.append(f"{vertex.label}: Cost = {vertex.cost}, Previous = {vertex.previous.label if vertex.previous else None}")
-        return result
+            yield f"{vertex.label}: Cost = {vertex.cost}, Previous = {vertex.previous.label if vertex.previous else None}"
 
-    def dials_algorithm(self, source, max_edge_cost):
+    def max_edge_cost(self):
+        return self.max_cost
+
+    def dials_algorithm(self, source, max_edge_cost=None):
+        # Dial's algorithm over a circular array of max_edge_cost + 1 buckets.
+        # Every tentative cost lies within [d, d + max_edge_cost] of the bucket being
+        # scanned, so slot cost % num_buckets is unambiguous. Entries whose cost
+        # dropped after they were queued are skipped lazily instead of removed.
+        if not self.integer_costs:
+            raise ValueError("Dial's algorithm requires non-negative integer edge costs.")
+        if max_edge_cost is None:
+            max_edge_cost = self.max_edge_cost()
+        elif self.max_edge_cost() > max_edge_cost:
+            raise ValueError(f"Edge cost {self.max_edge_cost()} exceeds max_edge_cost {max_edge_cost}.")
+
+        num_buckets = max_edge_cost + 1
+        buckets = [deque() for _ in range(num_buckets)]
         source.cost = 0
-        bucket = defaultdict(deque)
-        bucket[0].append(source)
-        max_cost = max_edge_cost * len(self.vertices)
+        buckets[0].append(source)
+        pending = 1
+        current_cost = 0
 
-        for i in range(max_cost + 1):
-            while bucket[i]:
-                current_vertex = bucket[i].popleft()
-                if current_vertex.cost < i:
-                    continue  # Skip already processed nodes with smaller cost
+        # Stop as soon as no queued entries remain: every reachable vertex is settled
+        while pending:
+            bucket = buckets[current_cost % num_buckets]
+            while bucket:
+                current_vertex = bucket.popleft()
+                pending -= 1
+                if current_vertex.cost != current_cost:
+                    continue  # Stale entry, the vertex was settled with a smaller cost
 
                 for edge in current_vertex.edges:
                     neighbor = edge.to_vertex
-                    new_cost = current_vertex.cost + edge.cost
+                    new_cost = current_cost + edge.cost
                     if new_cost < neighbor.cost:
-                        if neighbor.cost != float('inf'):
-                            bucket[neighbor.cost].remove(neighbor)
                         neighbor.cost = new_cost
                         neighbor.previous = current_vertex
-                        bucket[new_cost].append(neighbor)
+                        buckets[new_cost % num_buckets].append(neighbor)
+                        pending += 1
+            current_cost += 1
+
+        return self.format_results()
+
+    def radix_heap_algorithm(self, source):
+        # Dijkstra over a radix heap; needs non-negative integer costs like Dial's,
+        # but the heap has O(log(V * max_edge_cost)) buckets instead of one per cost value
+        if not self.integer_costs:
+            raise ValueError("The radix heap requires non-negative integer edge costs.")
+        source.cost = 0
+        heap = RadixHeap(self.max_cost * len(self.vertices))
+        heap.push(0, source)
+
+        while heap:
+            cost, current_vertex = heap.pop()
+            if cost != current_vertex.cost:
+                continue  # Stale entry
+
+            for edge in current_vertex.edges:
+                neighbor = edge.to_vertex
+                new_cost = cost + edge.cost
+                if new_cost < neighbor.cost:
+                    neighbor.cost = new_cost
+                    neighbor.previous = current_vertex
+                    heap.push(new_cost, neighbor)
+
+        return self.format_results()
+
+class RadixHeap:
+    """Monotone priority queue for non-negative integer keys.
+
+    Keys pushed must be at least the last popped key. An entry lives in the
+    bucket given by the highest bit in which its key differs from that last key,
+    so there is one bucket per bit of the largest key. Popping from an empty
+    bucket 0 redistributes the first non-empty bucket around its minimum, and
+    each entry can only move to lower buckets, for O(log max_key) amortised work.
+    """
+
+    __slots__ = ("last", "size", "buckets")
+
+    def __init__(self, max_key=2 ** 63 - 1):
+        self.last = 0
+        self.size = 0
+        self.buckets = [[] for _ in range(int(max_key).bit_length() + 1)]
+
+    def __len__(self):
+        return self.size
+
+    def push(self, key, value):
+        self.buckets[(key ^ self.last).bit_length()].append((key, value))
+        self.size += 1
+
+    def pop(self):
+        buckets = self.buckets
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+            bucket = buckets[i]
+            last = self.last = min(key for key, _ in bucket)
+            for entry in bucket:
+                buckets[(entry[0] ^ last).bit_length()].append(entry)
+            bucket.clear()
+        self.size -= 1
+        return buckets[0].pop()
+
+class CompactGraph:
+    """Read-only compressed sparse row (CSR) snapshot of a Graph.
+
+    Vertices are identified by their index. The outgoing edges of vertex i are
+    targets[offsets[i]:offsets[i + 1]] with the matching entries of costs.
+    """
+
+    __slots__ = ("labels", "xs", "ys", "offsets", "targets", "costs", "max_cost", "integer_costs",
+                 "_reverse", "_heuristic_scale", "_delta_split", "_fingerprint")
+
+    def __init__(self, labels, xs, ys, offsets, targets, costs, max_cost=None, integer_costs=None):
+        self.labels = labels
+        self.xs = xs
+        self.ys = ys
+        self.offsets = offsets
+        self.targets = targets
+        self.costs = costs
+        self.max_cost = max(costs, default=0) if max_cost is None else max_cost
+        if integer_costs is None:
+            integer_costs = all(cost >= 0 and cost == int(cost) for cost in costs)
+        self.integer_costs = integer_costs
+        self._reverse = None
+        self._heuristic_scale = None
+        self._delta_split = None
+        self._fingerprint = None
+
+    def __reduce__(self):
+        # Pickle only the CSR arrays, not the derived caches. Memory-mapped views
+        # can't be pickled, so a graph loaded from a file is copied into arrays.
+        buffers = [buffer if isinstance(buffer, array) else array(_typecode(buffer), buffer)
+                   for buffer in (self.xs, self.ys, self.offsets, self.targets, self.costs)]
+        labels = self.labels if isinstance(self.labels, list) else list(self.labels)
+        return (CompactGraph, (labels, *buffers, self.max_cost, self.integer_costs))
+
+    @classmethod
+    def from_graph(cls, graph):
+        vertices = graph.vertices
+        offsets = array('q', [0])
+        targets = array('q')
+        costs = array('q' if graph.integer_costs else 'd')
+        for vertex in vertices:
+            for edge in vertex.edges:
+                targets.append(edge.to_vertex.index)
+                costs.append(edge.cost)
+            offsets.append(len(targets))
+        return cls([vertex.label for vertex in vertices],
+                   array('d', (vertex.x for vertex in vertices)),
+                   array('d', (vertex.y for vertex in vertices)),
+                   offsets, targets, costs, graph.max_cost, graph.integer_costs)
+
+    @classmethod
+    def load(cls, path):
+        # Memory-mapped: the CSR arrays are views into the file, nothing is parsed.
+        # Undirected files store each edge once, so those edges are copied out in
+        # both directions instead.
+        f = graphfile.read_graph(path)
+        offsets, targets, costs = f.offsets, f.targets, f.costs
+        if not f.directed:
+            offsets, targets, costs = _undirected_to_csr(offsets, targets, costs)
+        return cls(f.labels, f.xs, f.ys, offsets, targets, costs, f.max_cost, f.integer_costs)
+
+    def save(self, path):
+        graphfile.write_graph(path, self.labels, self.xs, self.ys, self.offsets, self.targets, self.costs,
+                              directed=True, integer_costs=self.integer_costs)
+
+    @property
+    def num_vertices(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    def edges_from(self, vertex):
+        offsets, targets, costs = self.offsets, self.targets, self.costs
+        for k in range(offsets[vertex], offsets[vertex + 1]):
+            yield targets[k], costs[k]
+
+    def reverse(self):
+        # The same graph with every edge flipped, built once by counting sort
+        if self._reverse is None:
+            n = self.num_vertices
+            offsets, targets, costs = self.offsets, self.targets, self.costs
+            rev_offsets = array('q', [0]) * (n + 1)
+            for v in targets:
+                rev_offsets[v + 1] += 1
+            for i in range(n):
+                rev_offsets[i + 1] += rev_offsets[i]
+            fill = array('q', rev_offsets)
+            rev_targets = array('q', [0]) * len(targets)
+            rev_costs = array(_typecode(costs), [0]) * len(costs)
+            for u in range(n):
+                for k in range(offsets[u], offsets[u + 1]):
+                    v = targets[k]
+                    slot = fill[v]
+                    rev_targets[slot] = u
+                    rev_costs[slot] = costs[k]
+                    fill[v] = slot + 1
+            self._reverse = CompactGraph(self.labels, self.xs, self.ys, rev_offsets, rev_targets, rev_costs,
+                                         self.max_cost, self.integer_costs)
+            self._reverse._reverse = self
+        return self._reverse
+
+    def heuristic_scale(self):
+        # Largest factor s with s * euclidean_length(u, v) <= cost(u, v) on every edge,
+        # which makes s * euclidean distance an admissible and consistent A* heuristic
+        if self._heuristic_scale is None:
+            xs, ys, offsets, targets, costs = self.xs, self.ys, self.offsets, self.targets, self.costs
+            scale = float('inf')
+            for u in range(self.num_vertices):
+                for k in range(offsets[u], offsets[u + 1]):
+                    v = targets[k]
+                    length = math.hypot(xs[u] - xs[v], ys[u] - ys[v])
+                    if length > 0 and costs[k] < scale * length:
+                        scale = costs[k] / length
+            # No edge constrains the scale (e.g. no edges): the heuristic carries no information
+            self._heuristic_scale = 0.0 if scale == float('inf') else scale * (1 - 1e-9)
+        return self._heuristic_scale
+
+    def fingerprint(self):
+        # Digest of the CSR arrays, identifying the graph's content across processes
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=16)
+            for buffer in (self.offsets, self.targets, self.costs):
+                digest.update(_little_endian(buffer) if isinstance(buffer, array) else buffer)
+            self._fingerprint = digest.digest()
+        return self._fingerprint
+
+    def as_numpy(self):
+        # Zero-copy NumPy views over the CSR buffers
+        import numpy as np
+        return np.frombuffer(self.offsets, dtype=np.int64), np.frombuffer(self.targets, dtype=np.int64), \
+            np.frombuffer(self.costs, dtype=np.int64 if _typecode(self.costs) == 'q' else np.float64)
+
+    def dijkstra(self, source):
+        return self.format_results(*csr_dijkstra(self, source))
+
+    def dials_algorithm(self, source):
+        return self.format_results(*csr_dials(self, source))
+
+    def format_results(self, dist, previous):
+        return list(self.iter_results(dist, previous))
+
+    def iter_results(self, dist, previous):
+        labels = self.labels
+        for i, label in enumerate(labels):
+            yield f"{label}: Cost = {dist[i]}, Previous = {labels[previous[i]] if previous[i] >= 0 else None}"
+
+class ShortestPathTree:
+    """Result of a single-source query: per-vertex distances and predecessors."""
+
+    __slots__ = ("graph", "source", "dist", "previous")
+
+    def __init__(self, graph, source, dist, previous):
+        self.graph = graph
+        self.source = source
+        self.dist = dist
+        self.previous = previous
+
+    def distance(self, target):
+        return self.dist[target]
+
+    def path_to(self, target):
+        # Vertex indices from the source to target, or [] if target is unreachable
+        if self.dist[target] == float('inf'):
+            return []
+        path = [target]
+        while path[-1] != self.source:
+            path.append(self.previous[path[-1]])
+        path.reverse()
+        return path
+
+    def format_results(self):
+        return self.graph.format_results(self.dist, self.previous)
+
+    def iter_results(self):
+        return self.graph.iter_results(self.dist, self.previous)
+
+class DynamicShortestPaths:
+    """Shortest-path tree from one source, kept up to date under edge updates.
+
+    Edge changes made through this object repair only the part of the tree they
+    affect, in the style of Ramalingam and Reps: a cheaper edge propagates the
+    improvement outwards from its head, while a dearer or deleted tree edge
+    resets the subtree hanging below it and re-attaches that subtree from its
+    unaffected in-neighbours. When the affected subtree is larger than
+    recompute_threshold times the vertex count, or the graph was changed behind
+    this object's back, the tree is recomputed from scratch instead.
+    """
+
+    def __init__(self, graph, source, recompute_threshold=0.25):
+        self.graph = graph
+        self.source = source.index if isinstance(source, Vertex) else source
+        self.recompute_threshold = recompute_threshold
+        self.recompute()
+
+    def recompute(self):
+        graph = self.graph
+        n = len(graph.vertices)
+        self.in_edges = [[] for _ in range(n)]
+        for vertex in graph.vertices:
+            for edge in vertex.edges:
+                self.in_edges[edge.to_vertex.index].append(edge)
+        self.dist = [float('inf')] * n
+        self.parent_edge = [None] * n
+        self.children = [set() for _ in range(n)]
+        self.dist[self.source] = 0
+        self._propagate([(0, self.source)])
+        self._version = graph.version
+
+    def _sync(self):
+        # Vertices added since the last update just extend the arrays; any other
+        # change made without going through this object forces a full recompute
+        graph = self.graph
+        if graph.version == self._version:
+            return
+        added = len(graph.vertices) - len(self.dist)
+        if graph.version - self._version == added:
+            self.dist.extend([float('inf')] * added)
+            self.parent_edge.extend([None] * added)
+            self.children.extend(set() for _ in range(added))
+            self.in_edges.extend([] for _ in range(added))
+            self._version = graph.version
+        else:
+            self.recompute()
+
+    def _set_parent(self, vertex, edge):
+        old = self.parent_edge[vertex]
+        if old is not None:
+            self.children[old.from_vertex.index].discard(vertex)
+        self.parent_edge[vertex] = edge
+        if edge is not None:
+            self.children[edge.from_vertex.index].add(vertex)
+
+    def _propagate(self, heap):
+        # Dijkstra continued from the given (cost, vertex) entries
+        dist = self.dist
+        vertices = self.graph.vertices
+        heapq.heapify(heap)
+        while heap:
+            cost, u = heapq.heappop(heap)
+            if cost > dist[u]:
+                continue
+            for edge in vertices[u].edges:
+                v = edge.to_vertex.index
+                new_cost = cost + edge.cost
+                if new_cost < dist[v]:
+                    dist[v] = new_cost
+                    self._set_parent(v, edge)
+                    heapq.heappush(heap, (new_cost, v))
+
+    def add_edge(self, from_vertex, to_vertex, cost=1):
+        self._sync()
+        edge = self.graph.add_edge(from_vertex, to_vertex, cost)
+        self._version = self.graph.version
+        self.in_edges[to_vertex.index].append(edge)
+        self._decreased(edge)
+        return edge
+
+    def set_edge_cost(self, edge, cost):
+        self._sync()
+        old_cost = edge.cost
+        self.graph.set_edge_cost(edge, cost)
+        self._version = self.graph.version
+        if cost < old_cost:
+            self._decreased(edge)
+        elif cost > old_cost:
+            self._increased(edge)
+
+    def remove_edge(self, edge):
+        self._sync()
+        self.graph.remove_edge(edge)
+        self._version = self.graph.version
+        self.in_edges[edge.to_vertex.index].remove(edge)
+        self._increased(edge)
+
+    def _decreased(self, edge):
+        u, v = edge.from_vertex.index, edge.to_vertex.index
+        new_cost = self.dist[u] + edge.cost
+        if new_cost < self.dist[v]:
+            self.dist[v] = new_cost
+            self._set_parent(v, edge)
+            self._propagate([(new_cost, v)])
+
+    def _increased(self, edge):
+        # Only a tree edge can make distances grow
+        v = edge.to_vertex.index
+        if self.parent_edge[v] is not edge:
+            return
+
+        affected = [v]
+        for w in affected:
+            affected.extend(self.children[w])
+        if len(affected) > self.recompute_threshold * len(self.dist):
+            self.recompute()
+            return
 
+        dist = self.dist
+        for w in affected:
+            dist[w] = float('inf')
+            self._set_parent(w, None)
+        # Re-attach each affected vertex through its best unaffected in-neighbour
+        heap = []
+        for w in affected:
+            for in_edge in self.in_edges[w]:
+                candidate = dist[in_edge.from_vertex.index] + in_edge.cost
+                if candidate < dist[w]:
+                    dist[w] = candidate
+                    self._set_parent(w, in_edge)
+            if dist[w] != float('inf'):
+                heap.append((dist[w], w))
+        self._propagate(heap)
+
+    def distance(self, target):
+        self._sync()
+        return self.dist[target.index if isinstance(target, Vertex) else target]
+
+    def path_to(self, target):
+        # Vertices from the source to target, or [] if target is unreachable
+        self._sync()
+        target = target.index if isinstance(target, Vertex) else target
+        if self.dist[target] == float('inf'):
+            return []
+        vertices = self.graph.vertices
+        path = [vertices[target]]
+        while path[-1].index != self.source:
+            path.append(self.parent_edge[path[-1].index].from_vertex)
+        path.reverse()
+        return path
+
+    def format_results(self):
+        self._sync()
         result = []
-        for vertex in self.vertices:
-            result.append(f"{vertex.label}: Cost = {vertex.cost}, Previous = {vertex.previous.label if vertex.previous else None}")
+        for vertex in self.graph.vertices:
+            edge = self.parent_edge[vertex.index]
+            result.append(f"{vertex.label}: Cost = {self.dist[vertex.index]}, Previous = {edge.from_vertex.label if edge else None}")
         return result
 
+# Shortest-path engines over a CompactGraph. They take the source vertex index and
+# return (dist, previous) where previous[i] is -1 for the source and unreachable vertices.
+
+def csr_dijkstra(compact, source):
+    offsets, targets, costs = compact.offsets, compact.targets, compact.costs
+    n = compact.num_vertices
+    dist = [float('inf')] * n
+    previous = array('q', [-1]) * n
+    settled = bytearray(n)
+    dist[source] = 0
+    heap = [(0, source)]
+
+    while heap:
+        cost, u = heapq.heappop(heap)
+        if settled[u]:
+            continue
+        settled[u] = 1
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            new_cost = cost + costs[k]
+            if new_cost < dist[v]:
+                dist[v] = new_cost
+                previous[v] = u
+                heapq.heappush(heap, (new_cost, v))
+
+    return dist, previous
+
+def csr_delta_stepping(compact, source, delta=None, workers=1):
+    # Delta-stepping (Meyer & Sanders). Vertices are grouped in buckets of width
+    # delta; all light edges (cost <= delta) leaving the current bucket are relaxed
+    # together as NumPy array operations, heavy edges once the bucket is settled.
+    # With workers > 1 the relaxation of large frontiers is split across threads;
+    # NumPy releases the GIL inside the gather/sort kernels.
+    try:
+        import numpy as np
+    except ImportError:
+        return _delta_stepping_python(compact, source, delta)
+
+    n = compact.num_vertices
+    offsets, targets, costs = compact.as_numpy()
+    if delta is None:
+        delta = float(costs.mean()) if len(costs) else 1.0
+    delta = delta or 1.0
+    light_end, targets, costs = _delta_split(compact, delta, np)
+
+    dist = np.full(n, np.inf)
+    previous = np.full(n, -1, dtype=np.int64)
+    settled = np.zeros(n, dtype=bool)
+    dist[source] = 0
+    pending = np.array([source], dtype=np.int64)
+    pool = ThreadPoolExecutor(workers) if workers > 1 else None
+
+    def expand(frontier, starts, ends):
+        # Every edge in [starts[i], ends[i]) of frontier[i] as flat source/target/cost arrays
+        counts = ends - starts
+        total = int(counts.sum())
+        if total == 0:
+            return None
+        edge = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+        sources = np.repeat(frontier, counts)
+        return sources, targets[edge], dist[sources] + costs[edge]
+
+    def relax(frontier, starts, ends):
+        if pool is not None and len(frontier) >= 4096 * workers:
+            chunks = np.array_split(np.arange(len(frontier)), workers)
+            parts = [p for p in pool.map(lambda c: expand(frontier[c], starts[c], ends[c]), chunks) if p is not None]
+            if not parts:
+                return frontier[:0]
+            sources, tails, candidates = (np.concatenate(column) for column in zip(*parts))
+        else:
+            part = expand(frontier, starts, ends)
+            if part is None:
+                return frontier[:0]
+            sources, tails, candidates = part
+        improving = candidates < dist[tails]
+        sources, tails, candidates = sources[improving], tails[improving], candidates[improving]
+        # Keep the cheapest candidate per target vertex
+        order = np.lexsort((candidates, tails))
+        tails, sources, candidates = tails[order], sources[order], candidates[order]
+        first = np.ones(len(tails), dtype=bool)
+        first[1:] = tails[1:] != tails[:-1]
+        tails, sources, candidates = tails[first], sources[first], candidates[first]
+        dist[tails] = candidates
+        previous[tails] = sources
+        return tails
+
+    try:
+        while len(pending):
+            pending = np.unique(pending)
+            pending = pending[~settled[pending]]
+            if not len(pending):
+                break
+            # Bucket by integer index, as the pure-Python version does; comparing
+            # against a float bucket end can round onto the minimum and empty the bucket
+            bucket = dist[pending].min() // delta
+            in_bucket = dist[pending] // delta <= bucket
+            frontier, pending = pending[in_bucket], pending[~in_bucket]
+            removed = []
+            while len(frontier):
+                removed.append(frontier)
+                improved = relax(frontier, offsets[frontier], light_end[frontier])
+                in_bucket = dist[improved] // delta <= bucket
+                frontier = improved[in_bucket]
+                pending = np.concatenate((pending, improved[~in_bucket]))
+            if not removed:
+                continue
+            removed = np.unique(np.concatenate(removed))
+            settled[removed] = True
+            pending = np.concatenate((pending, relax(removed, light_end[removed], offsets[removed + 1])))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if compact.integer_costs:
+        dist = [int(d) if d != np.inf else float('inf') for d in dist.tolist()]
+    else:
+        dist = dist.tolist()
+    return dist, array('q', previous.tobytes())
+
+def _delta_split(compact, delta, np):
+    # Reorder each vertex's edges so light ones come first; cached per delta
+    if compact._delta_split is None or compact._delta_split[0] != delta:
+        offsets, targets, costs = compact.as_numpy()
+        tails = np.repeat(np.arange(compact.num_vertices), np.diff(offsets))
+        heavy = costs > delta
+        order = np.lexsort((heavy, tails))
+        light_end = offsets[:-1] + np.bincount(tails[~heavy], minlength=compact.num_vertices)
+        compact._delta_split = (delta, (light_end, targets[order], costs[order]))
+    return compact._delta_split[1]
+
+def _delta_stepping_python(compact, source, delta=None):
+    # Sequential delta-stepping for when NumPy is not installed
+    offsets, targets, costs = compact.offsets, compact.targets, compact.costs
+    n = compact.num_vertices
+    if delta is None:
+        delta = sum(costs) / len(costs) if len(costs) else 1
+    delta = delta or 1
+    dist = [float('inf')] * n
+    previous = array('q', [-1]) * n
+    dist[source] = 0
+    buckets = {0: {source}}
+
+    def relax(u, light):
+        for k in range(offsets[u], offsets[u + 1]):
+            if (costs[k] <= delta) != light:
+                continue
+            v = targets[k]
+            new_cost = dist[u] + costs[k]
+            if new_cost < dist[v]:
+                if dist[v] != float('inf'):
+                    buckets.get(int(dist[v] // delta), set()).discard(v)
+                dist[v] = new_cost
+                previous[v] = u
+                buckets.setdefault(int(new_cost // delta), set()).add(v)
+
+    while buckets:
+        i = min(buckets)
+        removed = set()
+        while buckets.get(i):
+            frontier = buckets.pop(i)
+            removed |= frontier
+            for u in frontier:
+                relax(u, True)
+        buckets.pop(i, None)
+        for u in removed:
+            relax(u, False)
+
+    return dist, previous
+
+# Point-to-point engines. They stop once the target is settled and return
+# (cost, path) with path as a list of vertex indices, or (inf, []) if unreachable.
+
+def trace_path(previous, source, target):
+    path = [target]
+    while path[-1] != source:
+        path.append(previous[path[-1]])
+    path.reverse()
+    return path
+
+def csr_dijkstra_to(compact, source, target):
+    offsets, targets, costs = compact.offsets, compact.targets, compact.costs
+    dist = {source: 0}
+    previous = {}
+    settled = set()
+    heap = [(0, source)]
+
+    while heap:
+        cost, u = heapq.heappop(heap)
+        if u in settled:
+            continue
+        if u == target:
+            return cost, trace_path(previous, source, target)
+        settled.add(u)
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            new_cost = cost + costs[k]
+            if new_cost < dist.get(v, float('inf')):
+                dist[v] = new_cost
+                previous[v] = u
+                heapq.heappush(heap, (new_cost, v))
+
+    return float('inf'), []
+
+def csr_astar(compact, source, target):
+    offsets, targets, costs = compact.offsets, compact.targets, compact.costs
+    xs, ys = compact.xs, compact.ys
+    tx, ty = xs[target], ys[target]
+    scale = compact.heuristic_scale()
+    if scale == 0:
+        return csr_dijkstra_to(compact, source, target)
+
+    dist = {source: 0}
+    previous = {}
+    settled = set()
+    heap = [(scale * math.hypot(xs[source] - tx, ys[source] - ty), source)]
+
+    while heap:
+        _, u = heapq.heappop(heap)
+        if u in settled:
+            continue
+        if u == target:
+            return dist[u], trace_path(previous, source, target)
+        settled.add(u)
+        cost = dist[u]
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            new_cost = cost + costs[k]
+            if new_cost < dist.get(v, float('inf')):
+                dist[v] = new_cost
+                previous[v] = u
+                heapq.heappush(heap, (new_cost + scale * math.hypot(xs[v] - tx, ys[v] - ty), v))
+
+    return float('inf'), []
+
+def csr_bidirectional(compact, source, target):
+    if source == target:
+        return 0, [source]
+    # Index 0 searches forward from the source, index 1 backward from the target
+    graphs = (compact, compact.reverse())
+    dists = ({source: 0}, {target: 0})
+    previous = ({}, {})
+    settled = (set(), set())
+    heaps = ([(0, source)], [(0, target)])
+    best, meeting = float('inf'), None
+
+    while heaps[0] and heaps[1]:
+        # Once the two frontiers together exceed the best meeting cost, it is optimal
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        cost, u = heapq.heappop(heaps[side])
+        if u in settled[side]:
+            continue
+        settled[side].add(u)
+        graph, dist, other = graphs[side], dists[side], dists[1 - side]
+        offsets, targets, costs = graph.offsets, graph.targets, graph.costs
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            new_cost = cost + costs[k]
+            if new_cost < dist.get(v, float('inf')):
+                dist[v] = new_cost
+                previous[side][v] = u
+                heapq.heappush(heaps[side], (new_cost, v))
+            if v in other and new_cost + other[v] < best:
+                best, meeting = new_cost + other[v], v
+
+    if meeting is None:
+        return float('inf'), []
+    forward = trace_path(previous[0], source, meeting)
+    backward = trace_path(previous[1], target, meeting)
+    return best, forward + backward[-2::-1]
+
+def csr_dials(compact, source):
+    if not compact.integer_costs:
+        raise ValueError("Dial's algorithm requires non-negative integer edge costs.")
+    offsets, targets, costs = compact.offsets, compact.targets, compact.costs
+    n = compact.num_vertices
+    dist = [float('inf')] * n
+    previous = array('q', [-1]) * n
+    num_buckets = int(compact.max_cost) + 1
+    buckets = [[] for _ in range(num_buckets)]
+    dist[source] = 0
+    buckets[0].append(source)
+    pending = 1
+    current_cost = 0
+
+    while pending:
+        bucket = buckets[current_cost % num_buckets]
+        while bucket:
+            u = bucket.pop()
+            pending -= 1
+            if dist[u] != current_cost:
+                continue
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                new_cost = current_cost + costs[k]
+                if new_cost < dist[v]:
+                    dist[v] = new_cost
+                    previous[v] = u
+                    buckets[new_cost % num_buckets].append(v)
+                    pending += 1
+        current_cost += 1
+
+    return dist, previous
+
+def csr_radix(compact, source):
+    if not compact.integer_costs:
+        raise ValueError("The radix heap requires non-negative integer edge costs.")
+    offsets, targets, costs = compact.offsets, compact.targets, compact.costs
+    n = compact.num_vertices
+    dist = [float('inf')] * n
+    previous = array('q', [-1]) * n
+    dist[source] = 0
+    heap = RadixHeap(int(compact.max_cost) * n)
+    heap.push(0, source)
+
+    while heap:
+        cost, u = heap.pop()
+        if cost != dist[u]:
+            continue
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            new_cost = cost + costs[k]
+            if new_cost < dist[v]:
+                dist[v] = new_cost
+                previous[v] = u
+                heap.push(new_cost, v)
+
+    return dist, previous
+
+class ContractionHierarchy:
+    """Contraction hierarchy over a CompactGraph for repeated point-to-point queries.
+
+    Vertices are contracted from least to most important, adding shortcut edges
+    that keep distances between the remaining vertices exact. A query is a
+    bidirectional Dijkstra that only moves towards higher-ranked vertices, so it
+    settles a tiny part of the graph.
+    """
+
+    MAGIC = b"PCH2"
+    HEADER = struct.Struct("<4sqqqqqc7x16s")
+
+    __slots__ = ("version", "fingerprint", "rank", "up_offsets", "up_targets", "up_costs",
+                 "down_offsets", "down_targets", "down_costs", "shortcuts")
+
+    def __init__(self, version, fingerprint, rank, up_offsets, up_targets, up_costs,
+                 down_offsets, down_targets, down_costs, shortcuts):
+        self.version = version
+        # CompactGraph.fingerprint() of the graph it was built from
+        self.fingerprint = fingerprint
+        self.rank = rank
+        # Upward graph: u -> w with rank[w] > rank[u], searched from the source
+        self.up_offsets = up_offsets
+        self.up_targets = up_targets
+        self.up_costs = up_costs
+        # Downward graph stored reversed: entry w at u means edge w -> u with
+        # rank[w] > rank[u], searched from the target
+        self.down_offsets = down_offsets
+        self.down_targets = down_targets
+        self.down_costs = down_costs
+        # (u, w) -> middle vertex of the shortcut u -> middle -> w
+        self.shortcuts = shortcuts
+
+    @classmethod
+    def build(cls, compact, version=0, witness_limit=500):
+        n = compact.num_vertices
+        offsets, targets, costs = compact.offsets, compact.targets, compact.costs
+        inf = float('inf')
+
+        # Remaining graph as dicts keeping the cheapest parallel edge
+        out_edges = [{} for _ in range(n)]
+        in_edges = [{} for _ in range(n)]
+        for u in range(n):
+            for k in range(offsets[u], offsets[u + 1]):
+                v, cost = targets[k], costs[k]
+                if u != v and cost < out_edges[u].get(v, inf):
+                    out_edges[u][v] = cost
+                    in_edges[v][u] = cost
+
+        def witness_search(start, skip, max_cost, goals):
+            # Bounded Dijkstra in the remaining graph that avoids the vertex being
+            # contracted; stops once every vertex in goals is settled
+            dist = {start: 0}
+            if not goals:
+                return dist
+            heap = [(0, start)]
+            settled = 0
+            remaining = len(goals)
+            while heap and settled < witness_limit:
+                d, x = heapq.heappop(heap)
+                if d > max_cost:
+                    break
+                if d > dist[x]:
+                    continue
+                settled += 1
+                if x in goals:
+                    remaining -= 1
+                    if not remaining:
+                        break
+                for y, cost in out_edges[x].items():
+                    if y != skip and d + cost < dist.get(y, inf):
+                        dist[y] = d + cost
+                        heapq.heappush(heap, (d + cost, y))
+            return dist
+
+        def needed_shortcuts(v):
+            outs = out_edges[v]
+            if not outs:
+                return []
+            max_out = max(outs.values())
+            result = []
+            for u, in_cost in in_edges[v].items():
+                dist = witness_search(u, v, in_cost + max_out, outs.keys() - {u})
+                for w, out_cost in outs.items():
+                    if w != u and dist.get(w, inf) > in_cost + out_cost:
+                        result.append((u, w, in_cost + out_cost))
+            return result
+
+        contracted_neighbors = [0] * n
+        level = [0] * n
+
+        def priority(v):
+            # Edge difference, plus terms that spread contraction evenly over the
+            # graph and keep the hierarchy shallow. The shortcuts are returned too,
+            # so contracting v right after doesn't repeat the witness searches.
+            needed = needed_shortcuts(v)
+            edge_difference = len(needed) - len(in_edges[v]) - len(out_edges[v])
+            return 2 * edge_difference + contracted_neighbors[v] + level[v], needed
+
+        heap = [(priority(v)[0], v) for v in range(n)]
+        heapq.heapify(heap)
+        rank = array('q', [0]) * n
+        up = [None] * n
+        down = [None] * n
+        shortcuts = {}
+        contracted = bytearray(n)
+        next_rank = 0
+
+        while heap:
+            _, v = heapq.heappop(heap)
+            if contracted[v]:
+                continue
+            # Lazy update: re-evaluate and put back if no longer the cheapest
+            current, needed = priority(v)
+            if heap and current > heap[0][0]:
+                heapq.heappush(heap, (current, v))
+                continue
+
+            for u, w, cost in needed:
+                if cost < out_edges[u].get(w, inf):
+                    out_edges[u][w] = cost
+                    in_edges[w][u] = cost
+                    shortcuts[(u, w)] = v
+
+            contracted[v] = 1
+            rank[v] = next_rank
+            next_rank += 1
+            up[v] = out_edges[v]
+            down[v] = in_edges[v]
+            for u in in_edges[v]:
+                del out_edges[u][v]
+                contracted_neighbors[u] += 1
+                level[u] = max(level[u], level[v] + 1)
+            for w in out_edges[v]:
+                del in_edges[w][v]
+                contracted_neighbors[w] += 1
+                level[w] = max(level[w], level[v] + 1)
+
+        cost_type = _typecode(costs)
+        up_offsets, up_targets, up_costs = _adjacency_to_csr(up, cost_type)
+        down_offsets, down_targets, down_costs = _adjacency_to_csr(down, cost_type)
+        return cls(version, compact.fingerprint(), rank, up_offsets, up_targets, up_costs,
+                   down_offsets, down_targets, down_costs, shortcuts)
+
+    def query(self, source, target):
+        if source == target:
+            return 0, [source]
+        inf = float('inf')
+        sides = ((self.up_offsets, self.up_targets, self.up_costs),
+                 (self.down_offsets, self.down_targets, self.down_costs))
+        dists = ({source: 0}, {target: 0})
+        previous = ({}, {})
+        heaps = ([(0, source)], [(0, target)])
+        best, meeting = inf, None
+
+        while heaps[0] or heaps[1]:
+            # Alternate directions; a direction is finished once its frontier reaches best
+            for side in (0, 1):
+                heap = heaps[side]
+                if not heap:
+                    continue
+                if heap[0][0] >= best:
+                    heap.clear()
+                    continue
+                d, u = heapq.heappop(heap)
+                dist = dists[side]
+                if d > dist[u]:
+                    continue
+                other = dists[1 - side].get(u)
+                if other is not None and d + other < best:
+                    best, meeting = d + other, u
+                offsets, targets, costs = sides[side]
+                for k in range(offsets[u], offsets[u + 1]):
+                    v = targets[k]
+                    new_cost = d + costs[k]
+                    if new_cost < dist.get(v, inf):
+                        dist[v] = new_cost
+                        previous[side][v] = u
+                        heapq.heappush(heap, (new_cost, v))
+
+        if meeting is None:
+            return inf, []
+        path = trace_path(previous[0], source, meeting) + trace_path(previous[1], target, meeting)[-2::-1]
+        return best, self.unpack(path)
+
+    def unpack(self, path):
+        # Expand shortcut edges back into the original edges they stand for
+        result = [path[0]]
+        shortcuts = self.shortcuts
+        for a, b in zip(path, path[1:]):
+            stack = [(a, b)]
+            while stack:
+                u, w = stack.pop()
+                middle = shortcuts.get((u, w))
+                if middle is None:
+                    result.append(w)
+                else:
+                    stack.append((middle, w))
+                    stack.append((u, middle))
+        return result
+
+    def to_bytes(self):
+        shortcut_u = array('q', (u for u, _ in self.shortcuts))
+        shortcut_w = array('q', (w for _, w in self.shortcuts))
+        shortcut_mid = array('q', self.shortcuts.values())
+        arrays = (self.rank, self.up_offsets, self.up_targets, self.up_costs,
+                  self.down_offsets, self.down_targets, self.down_costs,
+                  shortcut_u, shortcut_w, shortcut_mid)
+        header = self.HEADER.pack(self.MAGIC, self.version, len(self.rank), len(self.up_targets),
+                                  len(self.down_targets), len(self.shortcuts), self.up_costs.typecode.encode(),
+                                  self.fingerprint)
+        return header + b"".join(_little_endian(a).tobytes() for a in arrays)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, n, num_up, num_down, num_shortcuts, cost_type, fingerprint = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC:
+            raise ValueError("Not a contraction hierarchy file.")
+        cost_type = cost_type.decode()
+        layout = (('q', n), ('q', n + 1), ('q', num_up), (cost_type, num_up),
+                  ('q', n + 1), ('q', num_down), (cost_type, num_down),
+                  ('q', num_shortcuts), ('q', num_shortcuts), ('q', num_shortcuts))
+        position = cls.HEADER.size
+        arrays = []
+        for typecode, length in layout:
+            a = array(typecode)
+            a.frombytes(data[position:position + length * a.itemsize])
+            arrays.append(_little_endian(a))
+            position += length * a.itemsize
+        shortcuts = dict(zip(zip(arrays[7], arrays[8]), arrays[9]))
+        return cls(version, fingerprint, *arrays[:7], shortcuts)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+def _typecode(buffer):
+    # array.array and memoryview name their item type differently
+    return getattr(buffer, "typecode", None) or buffer.format
+
+def _adjacency_to_csr(adjacency, cost_type):
+    offsets = array('q', [0])
+    targets = array('q')
+    costs = array(cost_type)
+    for neighbors in adjacency:
+        targets.extend(neighbors.keys())
+        costs.extend(neighbors.values())
+        offsets.append(len(targets))
+    return offsets, targets, costs
+
+def _undirected_to_csr(offsets, targets, costs):
+    # CSR with every edge u - v listed under both u and v
+    adjacency = [[] for _ in range(len(offsets) - 1)]
+    for u, edges in enumerate(adjacency):
+        for k in range(offsets[u], offsets[u + 1]):
+            v, cost = targets[k], costs[k]
+            edges.append((v, cost))
+            if v != u:
+                adjacency[v].append((u, cost))
+    both_offsets = array('q', [0])
+    both_targets = array('q')
+    both_costs = array(_typecode(costs))
+    for edges in adjacency:
+        for v, cost in edges:
+            both_targets.append(v)
+            both_costs.append(cost)
+        both_offsets.append(len(both_targets))
+    return both_offsets, both_targets, both_costs
+
+def _little_endian(a):
+    # Binary files are little-endian regardless of the host
+    if sys.byteorder == "big":
+        a = array(a.typecode, a)
+        a.byteswap()
+    return a
+
+ENGINES = {
+    "heap": csr_dijkstra,
+    "dials": csr_dials,
+    "delta": csr_delta_stepping,
+    "radix": csr_radix,
+}
+
+POINT_TO_POINT_ENGINES = {
+    "dijkstra": csr_dijkstra_to,
+    "bidirectional": csr_bidirectional,
+    "astar": csr_astar,
+}
+
+# Per-process state for Graph.iter_batch_shortest_paths workers
+_batch_graph = None
+_batch_engine = None
+_batch_options = None
+
+def _batch_worker_init(compact, engine, options):
+    global _batch_graph, _batch_engine, _batch_options
+    _batch_graph, _batch_engine, _batch_options = compact, ENGINES[engine], options
+
+def _batch_worker_run(source):
+    dist, _ = _batch_engine(_batch_graph, source, **_batch_options)
+    return source, array('d', dist)
+
 class DijkstraApp:
     def __init__(self, master):
         self.master = master
@@ -92,6 +1395,8 @@ class DijkstraApp:
         self.current_mode = tk.StringVar(value="drawVertex")
         self.selected_vertex = None
         self.start_vertex = None
+        # Vertex costs entered in "Set cost" mode, applied before each linear-scan run
+        self.preset_costs = {}
 
         # Frame for the graph canvas
         self.graph_frame = tk.Frame(master, bg="#ffffff")
@@ -101,7 +1406,20 @@ class DijkstraApp:
         self.canvas = tk.Canvas(self.graph_frame, width=640, height=480, bg='#ffffff')
         self.canvas.pack()
 
+        # View transform: screen = world * scale + offset
+        self.scale = 1.0
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+        self.pan_start = None
+        self.redraw_pending = False
+
         self.canvas.bind("<Button-1>", self.on_canvas_click)
+        # Pan with the right mouse button, zoom with the wheel
+        self.canvas.bind("<ButtonPress-3>", self.on_pan_start)
+        self.canvas.bind("<B3-Motion>", self.on_pan_move)
+        self.canvas.bind("<MouseWheel>", self.on_zoom)
+        self.canvas.bind("<Button-4>", self.on_zoom)
+        self.canvas.bind("<Button-5>", self.on_zoom)
 
         # Frame for controls on the right
         self.control_frame = tk.Frame(master, bg="#2e2e2e")
@@ -117,24 +1435,69 @@ class DijkstraApp:
         self.dijkstra_button = tk.Button(self.control_frame, text="Run Dijkstra", command=self.run_dijkstra, bg="#4caf50", fg="white", padx=10, pady=5)
         self.dijkstra_button.pack(pady=5)
 
+        # Dijkstra engine selection, so both implementations can be compared
+        self.dijkstra_engine = tk.StringVar(value="heap")
+        tk.Radiobutton(self.control_frame, text="Binary heap", variable=self.dijkstra_engine, value="heap", bg="#2e2e2e", fg="white", selectcolor="#4b4b4b").pack(anchor='w', padx=5)
+        tk.Radiobutton(self.control_frame, text="Linear scan", variable=self.dijkstra_engine, value="scan", bg="#2e2e2e", fg="white", selectcolor="#4b4b4b").pack(anchor='w', padx=5)
+
         self.dials_button = tk.Button(self.control_frame, text="Run Dial's Algorithm", command=self.run_dials_algorithm, bg="#2196f3", fg="white", padx=10, pady=5)
         self.dials_button.pack(pady=5)
 
+        # Graph files
+        self.open_button = tk.Button(self.control_frame, text="Open Graph...", command=self.open_graph, bg="#4b4b4b", fg="white", padx=10, pady=5)
+        self.open_button.pack(pady=5)
+
+        self.save_button = tk.Button(self.control_frame, text="Save Graph...", command=self.save_graph, bg="#4b4b4b", fg="white", padx=10, pady=5)
+        self.save_button.pack(pady=5)
+
         # Text area for results
         self.result_area = tk.Text(self.control_frame, height=10, width=40, bg="#f0f0f0", fg="black", padx=10, pady=10)
         self.result_area.pack(pady=10)
 
+    def to_world(self, x, y):
+        return (x - self.offset_x) / self.scale, (y - self.offset_y) / self.scale
+
+    def to_screen(self, x, y):
+        return x * self.scale + self.offset_x, y * self.scale + self.offset_y
+
+    def on_pan_start(self, event):
+        self.pan_start = (event.x, event.y)
+
+    def on_pan_move(self, event):
+        if self.pan_start is None:
+            return
+        self.offset_x += event.x - self.pan_start[0]
+        self.offset_y += event.y - self.pan_start[1]
+        self.pan_start = (event.x, event.y)
+        self.schedule_redraw()
+
+    def on_zoom(self, event):
+        factor = 1.2 if event.num == 4 or getattr(event, "delta", 0) > 0 else 1 / 1.2
+        # Keep the point under the cursor fixed
+        world_x, world_y = self.to_world(event.x, event.y)
+        self.scale = min(max(self.scale * factor, 0.01), 20.0)
+        self.offset_x = event.x - world_x * self.scale
+        self.offset_y = event.y - world_y * self.scale
+        self.schedule_redraw()
+
+    def schedule_redraw(self):
+        # Coalesce bursts of pan/zoom events into one redraw
+        if not self.redraw_pending:
+            self.redraw_pending = True
+            self.master.after_idle(self.redraw_graph)
+
     def on_canvas_click(self, event):
         mode = self.current_mode.get()
-        
+        x, y = self.to_world(event.x, event.y)
+
         if mode == "drawVertex":
             label = simpledialog.askstring("Input", "Enter vertex label (single character):")
             if label:
-                vertex = self.graph.add_vertex(label, event.x, event.y)
+                vertex = self.graph.add_vertex(label, x, y)
                 self.draw_vertex(vertex)
 
         elif mode == "drawEdge":
-            clicked_vertex = self.find_vertex_at(event.x, event.y)
+            clicked_vertex = self.find_vertex_at(x, y)
             if clicked_vertex:
                 if self.start_vertex is None:
                     self.start_vertex = clicked_vertex
@@ -146,43 +1509,96 @@ class DijkstraApp:
                     self.start_vertex = None
 
         elif mode == "setStart":
-            self.selected_vertex = self.find_vertex_at(event.x, event.y)
+            self.selected_vertex = self.find_vertex_at(x, y)
             if self.selected_vertex:
                 self.selected_vertex.is_source = True
                 messagebox.showinfo("Vertex Selected", f"Starting vertex set to {self.selected_vertex.label}")
 
         elif mode == "setCost":
-            vertex = self.find_vertex_at(event.x, event.y)
+            vertex = self.find_vertex_at(x, y)
             if vertex:
                 cost = simpledialog.askinteger("Input", "Enter new cost for vertex:")
                 if cost is not None:
-                    vertex.cost = cost
+                    self.preset_costs[vertex] = cost
                     messagebox.showinfo("Cost Set", f"Vertex {vertex.label} cost set to {cost}")
 
     def draw_vertex(self, vertex):
-        x, y = vertex.x, vertex.y
+        x, y = self.to_screen(vertex.x, vertex.y)
+        half = 20 * self.scale
         # Create a more detailed polygon for the vertex
-        self.canvas.create_polygon(x - 20, y - 20, x + 20, y - 20, x + 20, y + 20, x - 20, y + 20,
+        self.canvas.create_polygon(x - half, y - half, x + half, y - half, x + half, y + half, x - half, y + half,
                                     fill='#4caf50', outline='black', width=2, smooth=True)
-        self.canvas.create_text(x, y, text=vertex.label, fill="white", font=("Arial", 12, "bold"))
+        if self.scale >= 0.5:
+            self.canvas.create_text(x, y, text=vertex.label, fill="white", font=("Arial", max(int(12 * self.scale), 6), "bold"))
 
     def draw_edge(self, edge):
-        x1, y1 = edge.from_vertex.x, edge.from_vertex.y
-        x2, y2 = edge.to_vertex.x, edge.to_vertex.y
+        x1, y1 = self.to_screen(edge.from_vertex.x, edge.from_vertex.y)
+        x2, y2 = self.to_screen(edge.to_vertex.x, edge.to_vertex.y)
         # Draw a smooth line for the edge
-        self.canvas.create_line(x1, y1, x2, y2, fill='black', width=3, smooth=True)
-        mid_x, mid_y = (x1 + x2) / 2, (y1 + y2) / 2
-        self.canvas.create_text(mid_x, mid_y, text=str(edge.cost), fill="red", font=("Arial", 10))
+        self.canvas.create_line(x1, y1, x2, y2, fill='black', width=max(3 * self.scale, 1), smooth=True)
+        if self.scale >= 0.5:
+            mid_x, mid_y = (x1 + x2) / 2, (y1 + y2) / 2
+            self.canvas.create_text(mid_x, mid_y, text=str(edge.cost), fill="red", font=("Arial", max(int(10 * self.scale), 6)))
 
-    def find_vertex_at(self, x, y):
+    def viewport(self):
+        # Visible world rectangle, widened by a vertex half-size so partly visible shapes are kept
+        x0, y0 = self.to_world(0, 0)
+        x1, y1 = self.to_world(int(self.canvas["width"]), int(self.canvas["height"]))
+        return x0 - 20, y0 - 20, x1 + 20, y1 + 20
+
+    def redraw_graph(self):
+        # Only vertices and edges inside the viewport get canvas items
+        self.redraw_pending = False
+        self.canvas.delete("all")
+        x0, y0, x1, y1 = self.viewport()
         for vertex in self.graph.vertices:
-            if (vertex.x - 20 <= x <= vertex.x + 20) and (vertex.y - 20 <= y <= vertex.y + 20):
-                return vertex
-        return None
+            for edge in vertex.edges:
+                other = edge.to_vertex
+                if (max(vertex.x, other.x) >= x0 and min(vertex.x, other.x) <= x1
+                        and max(vertex.y, other.y) >= y0 and min(vertex.y, other.y) <= y1):
+                    self.draw_edge(edge)
+        for vertex in sorted(self.graph.spatial_index.query(x0, y0, x1, y1), key=lambda vertex: vertex.index):
+            self.draw_vertex(vertex)
+
+    def open_graph(self):
+        path = filedialog.askopenfilename(filetypes=[("Graph files", "*.graph"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            self.graph = Graph.load(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"Could not open graph: {e}")
+            return
+        self.selected_vertex = None
+        self.start_vertex = None
+        self.preset_costs = {}
+        self.result_area.delete(1.0, tk.END)
+        self.redraw_graph()
+
+    def save_graph(self):
+        path = filedialog.asksaveasfilename(defaultextension=".graph", filetypes=[("Graph files", "*.graph")])
+        if path:
+            try:
+                self.graph.save(path)
+            except OSError as e:
+                messagebox.showerror("Error", f"Could not save graph: {e}")
+
+    def find_vertex_at(self, x, y):
+        return self.graph.spatial_index.find(x, y, 20)
 
     def run_dijkstra(self):
         if self.selected_vertex:
-            results = self.graph.dijkstra(self.selected_vertex)
+            engine = self.dijkstra_engine.get()
+            if engine == "heap" and not self.preset_costs:
+                results = self.graph.shortest_paths(self.selected_vertex, "heap").iter_results()
+            else:
+                # The linear scan and preset costs work on the Vertex objects, so
+                # start from a clean slate rather than the previous run's costs
+                self.graph.reset_costs(self.preset_costs)
+                if engine == "heap":
+                    results = self.graph.dijkstra_heap(self.selected_vertex)
+                else:
+                    results = self.graph.dijkstra(self.selected_vertex)
             self.result_area.delete(1.0, tk.END)
             self.result_area.insert(tk.END, "\n".join(results))
         else:
@@ -190,15 +1606,119 @@ class DijkstraApp:
 
     def run_dials_algorithm(self):
         if self.selected_vertex:
-            max_edge_cost = simpledialog.askinteger("Input", "Enter the maximum edge cost:")
-            if max_edge_cost is not None:
-                results = self.graph.dials_algorithm(self.selected_vertex, max_edge_cost)
-                self.result_area.delete(1.0, tk.END)
-                self.result_area.insert(tk.END, "\n".join(results))
+            try:
+                results = self.graph.shortest_paths(self.selected_vertex, "dials").iter_results()
+            except ValueError as e:
+                messagebox.showerror("Error", str(e))
+                return
+            self.result_area.delete(1.0, tk.END)
+            self.result_area.insert(tk.END, "\n".join(results))
         else:
             messagebox.showwarning("Warning", "Please select a starting vertex.")
 
+# Headless use: edge lists are read in one streaming pass, one edge per row or record
+
+EDGE_RECORD = struct.Struct("<qqd")  # Binary edge list: from index, to index, cost
+
+def read_edge_list(path, fmt=None, graph=None, header=None):
+    # Returns (graph, {label: vertex}). fmt is "csv", "tsv" or "bin"; by default
+    # it is taken from the file extension. Text rows are "from,to[,cost]". With
+    # header=None the first row is skipped when its cost column is not a number
+    # or its vertex columns are column names like "from,to"; True or False
+    # always or never skips it.
+    if fmt is None:
+        fmt = {".tsv": "tsv", ".bin": "bin"}.get(os.path.splitext(path)[1].lower(), "csv")
+    graph = graph or Graph()
+    vertices = {vertex.label: vertex for vertex in graph.vertices}
+
+    def vertex_for(label):
+        vertex = vertices.get(label)
+        if vertex is None:
+            vertex = vertices[label] = graph.add_vertex(label, 0, 0)
+        return vertex
+
+    if fmt == "bin":
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(EDGE_RECORD.size * 4096)
+                if not chunk:
+                    break
+                for u, v, cost in EDGE_RECORD.iter_unpack(chunk):
+                    graph.add_edge(vertex_for(str(u)), vertex_for(str(v)), int(cost) if cost.is_integer() else cost)
+        return graph, vertices
+
+    with open(path, newline="") as f:
+        for line_number, row in enumerate(csv.reader(f, delimiter="\t" if fmt == "tsv" else ","), 1):
+            if not row or row[0].startswith("#"):
+                continue
+            if line_number == 1 and header is not None:
+                if header:
+                    continue
+            elif line_number == 1 and graphfile.is_header_row(row):
+                continue
+            if len(row) < 2:
+                raise ValueError(f"{path}:{line_number}: expected from,to[,cost]")
+            cost = row[2].strip() if len(row) > 2 else "1"
+            try:
+                cost = int(cost)
+            except ValueError:
+                try:
+                    cost = float(cost)
+                except ValueError:
+                    if line_number == 1 and header is None:
+                        continue
+                    raise ValueError(f"{path}:{line_number}: invalid edge cost {cost!r}")
+            graph.add_edge(vertex_for(row[0].strip()), vertex_for(row[1].strip()), cost)
+    return graph, vertices
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Shortest Path Solver. Without an edge list the GUI is started.")
+    parser.add_argument("edges", nargs="?", help="edge list (.csv, .tsv, .bin) or graph file (.graph)")
+    parser.add_argument("--format", choices=["csv", "tsv", "bin", "graph"], help="input format (default: from extension)")
+    parser.add_argument("--header", action=argparse.BooleanOptionalAction,
+                        help="text input starts with a header row (default: detected)")
+    parser.add_argument("-s", "--source", action="append", default=[], help="source vertex label, repeatable, or 'all'")
+    parser.add_argument("-a", "--algorithm", choices=["dijkstra", "dials", "delta", "radix"], default="dijkstra")
+    parser.add_argument("-o", "--output", help="write results here instead of stdout")
+    args = parser.parse_args(argv)
+
+    if args.edges is None:
+        root = tk.Tk()
+        app = DijkstraApp(root)
+        root.mainloop()
+        return 0
+
+    try:
+        if args.format == "graph" or (args.format is None and args.edges.lower().endswith(".graph")):
+            compact = CompactGraph.load(args.edges)
+        else:
+            compact = read_edge_list(args.edges, args.format, header=args.header)[0].freeze()
+    except (OSError, ValueError) as e:
+        parser.error(f"could not read {args.edges}: {e}")
+    if args.algorithm in ("dials", "radix") and not compact.integer_costs:
+        parser.error(f"-a {args.algorithm} needs non-negative integer edge costs; use dijkstra or delta")
+    if not args.source or "all" in args.source:
+        sources = range(compact.num_vertices)
+    else:
+        indices = {label: i for i, label in enumerate(compact.labels)}
+        missing = [label for label in args.source if label not in indices]
+        if missing:
+            parser.error(f"unknown source vertex: {', '.join(missing)}")
+        sources = [indices[label] for label in args.source]
+
+    engine = ENGINES["heap" if args.algorithm == "dijkstra" else args.algorithm]
+    out = open(args.output, "w") if args.output else sys.stdout
+    try:
+        for source in sources:
+            dist, previous = engine(compact, source)
+            out.write(f"Source: {compact.labels[source]}\n")
+            for line in compact.iter_results(dist, previous):
+                out.write(line)
+                out.write("\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = DijkstraApp(root)
-    root.mainloop()
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""Benchmarks for the PATH shortest-path engines on reproducible generated graphs.
+
+    python bench.py --sizes 1000 10000 --repeat 3 --output bench.json
+
+Every graph is generated from a seeded RNG, every engine is timed on the same
+sources, and all engines are checked against the CSR heap Dijkstra. The report
+is JSON; the exit status is 1 when any engine disagrees on a distance.
+"""
+import argparse
+import json
+import math
+import random
+import sys
+import time
+import tracemalloc
+
+import PATH
+
+# Graph generators. Each returns a PATH.Graph and is fully determined by its arguments.
+
+def random_sparse_graph(n, seed, degree=4, max_cost=100.0):
+    # Uniform random directed graph with real-valued costs
+    rng = random.Random(seed)
+    graph = PATH.Graph()
+    vertices = [graph.add_vertex(str(i), rng.uniform(0, 1000), rng.uniform(0, 1000)) for i in range(n)]
+    for vertex in vertices:
+        for _ in range(degree):
+            graph.add_edge(vertex, rng.choice(vertices), rng.uniform(1.0, max_cost))
+    return graph
+
+def grid_graph(n, seed, max_cost=100):
+    # Road-like grid: both directions between 4-neighbours, cost at least the
+    # Euclidean length so A* stays informative
+    rng = random.Random(seed)
+    side = max(int(math.isqrt(n)), 1)
+    graph = PATH.Graph()
+    rows = [[graph.add_vertex(f"{r},{c}", c * 10, r * 10) for c in range(side)] for r in range(side)]
+    for r in range(side):
+        for c in range(side):
+            for dr, dc in ((0, 1), (1, 0)):
+                if r + dr < side and c + dc < side:
+                    cost = rng.randint(10, max(max_cost, 10))
+                    graph.add_edge(rows[r][c], rows[r + dr][c + dc], cost)
+                    graph.add_edge(rows[r + dr][c + dc], rows[r][c], cost)
+    return graph
+
+def bounded_integer_graph(n, seed, degree=4, max_cost=10):
+    # Random directed graph with small integer costs, Dial's best case
+    rng = random.Random(seed)
+    graph = PATH.Graph()
+    vertices = [graph.add_vertex(str(i), 0, 0) for i in range(n)]
+    for vertex in vertices:
+        for _ in range(degree):
+            graph.add_edge(vertex, rng.choice(vertices), rng.randint(0, max_cost))
+    return graph
+
+GENERATORS = {
+    "sparse": random_sparse_graph,
+    "grid": grid_graph,
+    "bounded": bounded_integer_graph,
+}
+
+# Engines. Each takes (graph, source index) and returns a list of distances.
+
+def _object_engine(method):
+    def run(graph, source):
+        # The object-model algorithms write onto the vertices, so start clean
+        for vertex in graph.vertices:
+            vertex.cost = float('inf')
+            vertex.previous = None
+        method(graph, graph.vertices[source])
+        return [vertex.cost for vertex in graph.vertices]
+    return run
+
+def _csr_engine(engine):
+    def run(graph, source):
+        return engine(graph.freeze(), source)[0]
+    return run
+
+ENGINES = {
+    "scan": _object_engine(PATH.Graph.dijkstra),
+    "heap-objects": _object_engine(PATH.Graph.dijkstra_heap),
+    "dials-objects": _object_engine(PATH.Graph.dials_algorithm),
+    "radix-objects": _object_engine(PATH.Graph.radix_heap_algorithm),
+    "heap": _csr_engine(PATH.csr_dijkstra),
+    "dials": _csr_engine(PATH.csr_dials),
+    "delta": _csr_engine(PATH.csr_delta_stepping),
+    "radix": _csr_engine(PATH.csr_radix),
+}
+
+# Engines that only work on some graphs or are too slow beyond a size
+INTEGER_ONLY = {"dials-objects", "dials", "radix-objects", "radix"}
+MAX_SIZE = {"scan": 5000}
+
+def agree(expected, actual):
+    return len(expected) == len(actual) and all(
+        a == b or (a != float('inf') and math.isclose(a, b, rel_tol=1e-9)) for a, b in zip(expected, actual))
+
+def measure(run, graph, sources, repeat):
+    # One untimed warm-up run (imports, cached CSR splits), best wall time over
+    # repeats, then one traced pass for peak memory
+    run(graph, sources[0])
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [run(graph, source) for source in sources]
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    for source in sources:
+        run(graph, source)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak, results
+
+def run_benchmarks(kinds, sizes, engines, seed=0, sources=3, repeat=3):
+    report = []
+    disagreements = 0
+    for kind in kinds:
+        for size in sizes:
+            graph = GENERATORS[kind](size, seed)
+            graph.freeze()  # Build the CSR snapshot outside the timed region
+            picker = random.Random(seed)
+            chosen = [picker.randrange(len(graph.vertices)) for _ in range(sources)]
+            reference = [PATH.csr_dijkstra(graph.freeze(), source)[0] for source in chosen]
+            settled = sum(sum(1 for d in dist if d != float('inf')) for dist in reference)
+
+            for name in engines:
+                entry = {"graph": kind, "vertices": len(graph.vertices),
+                         "edges": graph.freeze().num_edges, "engine": name}
+                if name in INTEGER_ONLY and not graph.integer_costs:
+                    entry["skipped"] = "requires integer costs"
+                elif size > MAX_SIZE.get(name, float('inf')):
+                    entry["skipped"] = f"limited to {MAX_SIZE[name]} vertices"
+                else:
+                    seconds, peak, results = measure(ENGINES[name], graph, chosen, repeat)
+                    ok = all(agree(expected, actual) for expected, actual in zip(reference, results))
+                    disagreements += not ok
+                    entry.update({"seconds": seconds,
+                                  "settled_per_second": settled / seconds if seconds else None,
+                                  "peak_memory_bytes": peak,
+                                  "agrees": ok})
+                report.append(entry)
+                print(json.dumps(entry), file=sys.stderr)
+    return report, disagreements
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the PATH shortest-path engines.")
+    parser.add_argument("--graphs", nargs="+", choices=sorted(GENERATORS), default=sorted(GENERATORS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 10000])
+    parser.add_argument("--engines", nargs="+", choices=sorted(ENGINES), default=sorted(ENGINES))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sources", type=int, default=3, help="sources per graph")
+    parser.add_argument("--repeat", type=int, default=3, help="timed repetitions, best is reported")
+    parser.add_argument("-o", "--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report, disagreements = run_benchmarks(args.graphs, args.sizes, args.engines,
+                                           args.seed, args.sources, args.repeat)
+    text = json.dumps({"seed": args.seed, "results": report}, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 1 if disagreements else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""Benchmarks for the native MST engine against networkx.
+
+    python bench_mst.py --sizes 10000 100000 --repeat 3 --output bench_mst.json
+
+Graphs are generated from a seeded RNG and every engine runs on the same graph.
+The networkx engines get an nx.Graph built outside the timed region, so they
+are timed on the MST alone, just as the native engines are timed on arrays.
+Every forest's total weight is checked against networkx's Kruskal. The report
+is JSON; the exit status is 1 when any engine disagrees.
+"""
+import argparse
+import json
+import math
+import sys
+import time
+import tracemalloc
+
+import networkx as nx
+import numpy as np
+
+import mstengine
+
+# Graph generators. Each returns (n, u, v, w) and is fully determined by its arguments.
+
+def random_sparse_graph(n, seed, degree=5):
+    # Uniform random multigraph edges with real weights; duplicates are dropped
+    rng = np.random.default_rng(seed)
+    u = rng.integers(0, n, n * degree)
+    v = rng.integers(0, n, n * degree)
+    keep = np.unique(np.stack((np.minimum(u, v), np.maximum(u, v)), axis=1), axis=0, return_index=True)[1]
+    keep.sort()
+    return n, u[keep], v[keep], rng.uniform(1.0, 100.0, len(keep))
+
+def grid_graph(n, seed, max_weight=100):
+    # 4-neighbour grid with integer weights, so many ties
+    rng = np.random.default_rng(seed)
+    side = max(math.isqrt(n), 1)
+    ids = np.arange(side * side).reshape(side, side)
+    u = np.concatenate((ids[:, :-1].ravel(), ids[:-1, :].ravel()))
+    v = np.concatenate((ids[:, 1:].ravel(), ids[1:, :].ravel()))
+    return side * side, u, v, rng.integers(1, max_weight + 1, len(u)).astype(np.float64)
+
+def geometric_graph(n, seed, neighbors=6):
+    # Points in the unit square joined to nearby points, weighted by distance
+    rng = np.random.default_rng(seed)
+    points = rng.random((n, 2))
+    order = np.argsort(points[:, 0])
+    pairs = [(order[:-k], order[k:]) for k in range(1, neighbors + 1)]
+    u = np.concatenate([a for a, _ in pairs])
+    v = np.concatenate([b for _, b in pairs])
+    return n, u, v, np.hypot(*(points[u] - points[v]).T)
+
+GENERATORS = {
+    "sparse": random_sparse_graph,
+    "grid": grid_graph,
+    "geometric": geometric_graph,
+}
+
+# Engines. Each is given the prepared input and returns the forest's total weight.
+
+def _native_engine(algorithm):
+    def prepare(n, u, v, w):
+        return n, u, v, w
+
+    def run(prepared):
+        n, u, v, w = prepared
+        return float(w[mstengine.minimum_spanning_forest(n, u, v, w, algorithm)].sum())
+    return prepare, run
+
+def _networkx_engine(algorithm):
+    def prepare(n, u, v, w):
+        graph = nx.Graph()
+        graph.add_nodes_from(range(n))
+        graph.add_weighted_edges_from(zip(u.tolist(), v.tolist(), w.tolist()))
+        return graph
+
+    def run(graph):
+        return sum(d['weight'] for _, _, d in nx.minimum_spanning_edges(graph, algorithm=algorithm, data=True))
+    return prepare, run
+
+ENGINES = {
+    "kruskal": _native_engine("kruskal"),
+    "prim": _native_engine("prim"),
+    "boruvka": _native_engine("boruvka"),
+    "parallel-boruvka": _native_engine("parallel-boruvka"),
+    "nx-kruskal": _networkx_engine("kruskal"),
+    "nx-prim": _networkx_engine("prim"),
+    "nx-boruvka": _networkx_engine("boruvka"),
+}
+
+# networkx is too slow to be worth waiting for beyond these sizes
+MAX_SIZE = {"nx-boruvka": 200000}
+
+def measure(run, prepared, repeat):
+    # One untimed warm-up run, best wall time over repeats, then one traced pass
+    total = run(prepared)
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(prepared)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    run(prepared)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak, total
+
+def run_benchmarks(kinds, sizes, engines, seed=0, repeat=3):
+    report = []
+    disagreements = 0
+    for kind in kinds:
+        for size in sizes:
+            n, u, v, w = GENERATORS[kind](size, seed)
+            prepare, run = ENGINES["nx-kruskal"]
+            reference = run(prepare(n, u, v, w))
+            for name in engines:
+                entry = {"graph": kind, "vertices": n, "edges": len(u), "engine": name}
+                if size > MAX_SIZE.get(name, float('inf')):
+                    entry["skipped"] = f"limited to {MAX_SIZE[name]} vertices"
+                else:
+                    prepare, run = ENGINES[name]
+                    seconds, peak, total = measure(run, prepare(n, u, v, w), repeat)
+                    ok = math.isclose(total, reference, rel_tol=1e-9)
+                    disagreements += not ok
+                    entry.update({"seconds": seconds,
+                                  "edges_per_second": len(u) / seconds if seconds else None,
+                                  "peak_memory_bytes": peak,
+                                  "total_weight": total,
+                                  "agrees": ok})
+                report.append(entry)
+                print(json.dumps(entry), file=sys.stderr)
+    return report, disagreements
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the native MST engine against networkx.")
+    parser.add_argument("--graphs", nargs="+", choices=sorted(GENERATORS), default=sorted(GENERATORS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10000, 100000])
+    parser.add_argument("--engines", nargs="+", choices=sorted(ENGINES), default=sorted(ENGINES))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="timed repetitions, best is reported")
+    parser.add_argument("-o", "--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report, disagreements = run_benchmarks(args.graphs, args.sizes, args.engines, args.seed, args.repeat)
+    text = json.dumps({"seed": args.seed, "results": report}, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 1 if disagreements else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""Versioned binary graph files shared by PATH.py and MST.py.
+
+Layout (little-endian, every section starts on an 8-byte boundary):
+
+    header          magic, format version, flags, vertex/edge counts, max cost
+    label offsets   int64[num_vertices + 1] into the label blob
+    label blob      UTF-8 vertex labels, back to back
+    xs, ys          float64[num_vertices] vertex coordinates
+    offsets         int64[num_vertices + 1] CSR row offsets
+    targets         int64[num_edges] edge heads
+    costs           int64 or float64[num_edges] edge costs
+
+Undirected graphs store every edge once, under one of its endpoints.
+"""
+from array import array
+import mmap
+import struct
+import sys
+
+MAGIC = b"GRPH"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sIII qqq d")
+
+FLAG_DIRECTED = 1
+FLAG_INTEGER_COSTS = 2
+
+# Text edge lists ("from,to[,cost]" rows) are read by PATH, MST and mststream.
+# A first row whose vertex columns are one of these pairs names the columns
+# rather than two vertices.
+HEADER_NAMES = {("from", "to"), ("source", "target"), ("src", "dst"), ("tail", "head"), ("u", "v")}
+
+def is_header_row(row):
+    return len(row) > 1 and (row[0].strip().lower(), row[1].strip().lower()) in HEADER_NAMES
+
+def _padding(size):
+    return b"\0" * (-size % 8)
+
+def _write_array(f, a):
+    if sys.byteorder == "big":
+        a.byteswap()
+    f.write(a.tobytes())
+
+def write_graph(path, labels, xs, ys, offsets, targets, costs, directed=True, integer_costs=None):
+    # Arrays are array.array or anything with the same buffer layout (int64/float64)
+    if integer_costs is None:
+        integer_costs = all(cost >= 0 and cost == int(cost) for cost in costs)
+    encoded = [str(label).encode("utf-8") for label in labels]
+    label_offsets = array('q', [0])
+    for label in encoded:
+        label_offsets.append(label_offsets[-1] + len(label))
+    blob = b"".join(encoded)
+    flags = (FLAG_DIRECTED if directed else 0) | (FLAG_INTEGER_COSTS if integer_costs else 0)
+    max_cost = max(costs, default=0)
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, flags, 0, len(encoded), len(targets), len(blob), max_cost))
+        _write_array(f, label_offsets)
+        f.write(blob + _padding(len(blob)))
+        for values, typecode in ((xs, 'd'), (ys, 'd'), (offsets, 'q'), (targets, 'q')):
+            _write_array(f, array(typecode, values))
+        _write_array(f, array('q', map(int, costs)) if integer_costs else array('d', costs))
+
+class Labels:
+    """Vertex labels decoded on access straight from the mapped label blob."""
+
+    def __init__(self, offsets, blob):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        return bytes(self._blob[self._offsets[i]:self._offsets[i + 1]]).decode("utf-8")
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+class GraphFile:
+    """A graph file opened with mmap.
+
+    xs, ys, offsets, targets and costs are zero-copy memoryviews into the mapping;
+    numpy() returns zero-copy NumPy views of the same memory. The mapping stays
+    open for as long as this object or any of those views are alive.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if sys.byteorder == "big":
+            raise ValueError("Graph files can only be mapped on little-endian hosts.")
+        if len(self._map) < HEADER.size:
+            raise ValueError(f"{path} is not a graph file.")
+        magic, version, flags, _, n, m, label_bytes, max_cost = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a graph file.")
+        if version > FORMAT_VERSION:
+            raise ValueError(f"{path} uses graph format version {version}; this build reads up to {FORMAT_VERSION}.")
+        size = HEADER.size + label_bytes + (-label_bytes % 8) + 8 * (4 * n + 2 + 2 * m)
+        if len(self._map) < size:
+            raise ValueError(f"{path} is truncated: {len(self._map)} of {size} bytes.")
+        self.directed = bool(flags & FLAG_DIRECTED)
+        self.integer_costs = bool(flags & FLAG_INTEGER_COSTS)
+        self.max_cost = int(max_cost) if self.integer_costs else max_cost
+        self.num_vertices = n
+        self.num_edges = m
+
+        view = memoryview(self._map)
+        position = HEADER.size
+
+        def section(typecode, length):
+            nonlocal position
+            start = position
+            position += length * 8
+            return view[start:position].cast(typecode)
+
+        label_offsets = section('q', n + 1)
+        blob = view[position:position + label_bytes]
+        position += label_bytes + (-label_bytes % 8)
+        self.labels = Labels(label_offsets, blob)
+        self.xs = section('d', n)
+        self.ys = section('d', n)
+        self.offsets = section('q', n + 1)
+        self.targets = section('q', m)
+        self.costs = section('q' if self.integer_costs else 'd', m)
+
+    def numpy(self):
+        import numpy as np
+        return (np.frombuffer(self.offsets, dtype=np.int64), np.frombuffer(self.targets, dtype=np.int64),
+                np.frombuffer(self.costs, dtype=np.int64 if self.integer_costs else np.float64))
+
+    def edges(self):
+        # (from index, to index, cost) for every stored edge
+        offsets, targets, costs = self.offsets, self.targets, self.costs
+        for u in range(self.num_vertices):
+            for k in range(offsets[u], offsets[u + 1]):
+                yield u, targets[k], costs[k]
+
+def read_graph(path):
+    return GraphFile(path)
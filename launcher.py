@@ -0,0 +1,130 @@
+"""Fast-starting launcher for the MST, PATH, AES and DES tools.
+
+    python launcher.py                          pick a tool from a small window
+    python launcher.py mst [ARGS...]            start a tool; ARGS are passed to it
+    python launcher.py --profile-imports mst    import-time report for a tool
+    python launcher.py --profile-imports --eager mst
+
+Launcher options go before the tool name; everything after it is the tool's.
+
+Nothing heavy is imported here, and the tools themselves load networkx,
+matplotlib, NumPy and PyCryptodome on first use. The import profile runs the
+tool's import under python -X importtime in a fresh interpreter; --eager adds
+the modules the tool defers, to show what the lazy imports save. Modules the
+interpreter imports at startup are measured by a bare run and left out.
+"""
+import argparse
+import os
+import runpy
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+class Tool:
+    __slots__ = ("module", "title", "deferred")
+
+    def __init__(self, module, title, deferred=()):
+        self.module = module
+        self.title = title
+        self.deferred = deferred  # Heavy modules the tool imports on first use
+
+TOOLS = {
+    "mst": Tool("MST", "Minimum Spanning Trees",
+                ("networkx", "numpy", "matplotlib.figure", "matplotlib.backends.backend_tkagg", "mstengine")),
+    "path": Tool("PATH", "Shortest Path Solver", ("numpy",)),
+    "aes": Tool("AES", "AES Encryption/Decryption", ("Crypto.Cipher.AES", "Crypto.Util.Padding")),
+    "des": Tool("DES", "DES Encryption/Decryption", ("Crypto.Cipher.DES", "Crypto.Util.Padding")),
+}
+
+def launch(name, args=()):
+    # Runs the tool as __main__, exactly as "python MST.py ARGS" would
+    tool = TOOLS[name]
+    sys.argv = [os.path.join(HERE, tool.module + ".py"), *args]
+    if HERE not in sys.path:
+        sys.path.insert(0, HERE)
+    runpy.run_module(tool.module, run_name="__main__", alter_sys=True)
+
+def choose_tool():
+    import tkinter as tk
+    root = tk.Tk()
+    root.title("Launcher")
+    choice = []
+
+    def pick(name):
+        choice.append(name)
+        root.destroy()
+
+    for name, tool in TOOLS.items():
+        tk.Button(root, text=tool.title, width=30, command=lambda name=name: pick(name)).pack(padx=10, pady=5)
+    root.mainloop()
+    return choice[0] if choice else None
+
+def read_importtime(stderr):
+    # (self us, cumulative us, depth, module) for every "import time:" line
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue  # Column header
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((self_us, cumulative_us, depth, name.strip()))
+    return rows
+
+def run_importtime(code):
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          cwd=HERE, capture_output=True, text=True)
+
+def profile_imports(name, eager=False, top=15, out=sys.stdout):
+    tool = TOOLS[name]
+    modules = [tool.module, *(tool.deferred if eager else ())]
+    result = run_importtime("\n".join(f"import {module}" for module in modules))
+    if result.returncode != 0:
+        out.write(f"Importing {', '.join(modules)} failed:\n{result.stderr.strip().splitlines()[-1]}\n")
+        return result.returncode
+
+    # Every module is imported once, so the startup ones are exactly those a
+    # bare interpreter imports too; they are charged to the interpreter
+    startup = {row[3] for row in read_importtime(run_importtime("pass").stderr)}
+    rows = [row for row in read_importtime(result.stderr) if row[3] not in startup]
+    total = sum(row[0] for row in rows)
+    what = f"{tool.module} with its deferred modules" if eager else tool.module
+    out.write(f"Cold import of {what}: {total / 1000:.1f} ms across {len(rows)} modules"
+              f" (interpreter startup excluded)\n\n")
+    out.write("Top-level imports (cumulative):\n")
+    for self_us, cumulative_us, depth, module in rows:
+        if depth <= 0:
+            out.write(f"  {cumulative_us / 1000:9.1f} ms  {module}\n")
+    out.write(f"\nSlowest {top} modules (self time):\n")
+    for self_us, cumulative_us, depth, module in sorted(rows, reverse=True)[:top]:
+        out.write(f"  {self_us / 1000:9.1f} ms  {module}\n")
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Start one of the graph and cipher tools quickly.")
+    parser.add_argument("tool", nargs="?", choices=sorted(TOOLS), help="tool to start (default: choose in a window)")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="arguments passed on to the tool")
+    parser.add_argument("--profile-imports", action="store_true", help="report import times for the tool instead of starting it")
+    parser.add_argument("--eager", action="store_true", help="with --profile-imports, also import the modules the tool defers")
+    args = parser.parse_args(argv)
+
+    if args.profile_imports:
+        if args.tool is None:
+            parser.error("--profile-imports needs a tool")
+        if args.args:
+            parser.error(f"unexpected arguments after the tool: {' '.join(args.args)}")
+        return profile_imports(args.tool, args.eager)
+
+    name = args.tool or choose_tool()
+    if name is None:
+        return 0
+    launch(name, args.args)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,25 @@
+"""Deferred imports for the GUI tools.
+
+    np = LazyModule("numpy")
+
+binds a stand-in that imports numpy the first time one of its attributes is
+used, so a tool only pays for the heavy modules a run actually touches.
+"""
+import importlib
+
+class LazyModule:
+    """A module imported on first attribute access."""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        # Only reached for names not set in __init__, i.e. the module's own
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
@@ -0,0 +1,591 @@
+"""Minimum spanning forests over NumPy edge arrays.
+
+A graph is given as n (the number of vertices, numbered 0..n-1) and three
+parallel arrays: u, v (int64 endpoints) and w (edge weights). Every algorithm
+returns the indices of the chosen edges as an int64 array, in the order the
+algorithm selects them, so callers can animate the result. Ties between equal
+weights are broken by edge index, so all three algorithms pick the same forest.
+Self-loops are ignored.
+
+Every engine takes an optional check callback, called every CHECK_EVERY steps
+(each round for Borůvka); it may raise to abandon the computation.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import heapq
+import os
+
+import numpy as np
+
+ALGORITHMS = ("kruskal", "prim", "boruvka")
+
+# Rank reported for a component with no outgoing edge
+NO_EDGE = np.iinfo(np.int64).max
+
+CHECK_EVERY = 65536
+
+def _no_check():
+    pass
+
+class UnionFind:
+    """Disjoint sets over 0..n-1 with path compression and union by rank."""
+
+    def __init__(self, n):
+        # Plain lists: element access is much cheaper than on NumPy arrays
+        self.parent = list(range(n))
+        self.rank = [0] * n
+
+    def find(self, x):
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a, b):
+        # Returns False when a and b were already in the same set
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.rank[a] < self.rank[b]:
+            a, b = b, a
+        self.parent[b] = a
+        if self.rank[a] == self.rank[b]:
+            self.rank[a] += 1
+        return True
+
+def as_edge_arrays(u, v, w):
+    return (np.asarray(u, dtype=np.int64), np.asarray(v, dtype=np.int64), np.asarray(w))
+
+def from_networkx(graph, weight="weight", check=_no_check):
+    # (nodes, u, v, w) with u and v indexing into nodes
+    nodes = list(graph.nodes)
+    index = {node: i for i, node in enumerate(nodes)}
+    m = graph.number_of_edges()
+    u = np.empty(m, dtype=np.int64)
+    v = np.empty(m, dtype=np.int64)
+    w = np.empty(m, dtype=np.float64)
+    for k, (a, b, cost) in enumerate(graph.edges(data=weight, default=1.0)):
+        if not k % CHECK_EVERY:
+            check()
+        u[k], v[k], w[k] = index[a], index[b], cost
+    return nodes, u, v, w
+
+def kruskal(n, u, v, w, check=_no_check):
+    u, v, w = as_edge_arrays(u, v, w)
+    order = np.argsort(w, kind="stable")
+    sets = UnionFind(n)
+    chosen = []
+    for i, (k, a, b) in enumerate(zip(order.tolist(), u[order].tolist(), v[order].tolist())):
+        if not i % CHECK_EVERY:
+            check()
+        if sets.union(a, b):
+            chosen.append(k)
+            if len(chosen) == n - 1:
+                break
+    return np.array(chosen, dtype=np.int64)
+
+def _csr(n, u, v):
+    # Both directions of every edge; edge_ids maps a CSR slot back to its edge
+    heads = np.concatenate((u, v))
+    order = np.argsort(heads, kind="stable")
+    targets = np.concatenate((v, u))[order]
+    edge_ids = np.concatenate((np.arange(len(u)), np.arange(len(u))))[order]
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(heads, minlength=n), out=offsets[1:])
+    return offsets, targets, edge_ids
+
+def prim(n, u, v, w, check=_no_check):
+    u, v, w = as_edge_arrays(u, v, w)
+    offsets, targets, edge_ids = _csr(n, u, v)
+    slot_weights = w[edge_ids].tolist()
+    offsets, targets, edge_ids = offsets.tolist(), targets.tolist(), edge_ids.tolist()
+    visited = [False] * n
+    chosen = []
+    push, pop = heapq.heappush, heapq.heappop
+    steps = 0
+    # One tree per connected component, like networkx's spanning forest
+    for root in range(n):
+        if visited[root]:
+            continue
+        heap = [(0, -1, root)]
+        while heap:
+            steps += 1
+            if not steps % CHECK_EVERY:
+                check()
+            _, k, x = pop(heap)
+            if visited[x]:
+                continue
+            visited[x] = True
+            if k >= 0:
+                chosen.append(k)
+            for slot in range(offsets[x], offsets[x + 1]):
+                y = targets[slot]
+                if not visited[y]:
+                    push(heap, (slot_weights[slot], edge_ids[slot], y))
+    return np.array(chosen, dtype=np.int64)
+
+def _weight_ranks(w):
+    # Position of every edge in (weight, index) order; comparing ranks is a
+    # total order, which keeps Borůvka's per-component choices cycle free
+    order = np.argsort(w, kind="stable")
+    ranks = np.empty(len(w), dtype=np.int64)
+    ranks[order] = np.arange(len(w))
+    return order, ranks
+
+def component_minimums(num_components, cu, cv, ranks):
+    """Lowest rank of an edge leaving each component (NO_EDGE when none)."""
+    best = np.full(num_components, NO_EDGE, dtype=np.int64)
+    np.minimum.at(best, cu, ranks)
+    np.minimum.at(best, cv, ranks)
+    return best
+
+def contract(component, partner):
+    """Merge each component with the one across its minimum edge.
+
+    partner[c] is the component on the other end of c's minimum edge (c itself
+    when it has none). The pointers form trees whose roots are 2-cycles; the
+    lower label of each cycle becomes the root and pointer jumping flattens
+    the trees. Returns new dense component labels for every vertex and the
+    new component count.
+    """
+    labels = np.arange(len(partner))
+    mutual = partner[partner] == labels
+    partner = np.where(mutual & (labels < partner), labels, partner)
+    while True:
+        jumped = partner[partner]
+        if np.array_equal(jumped, partner):
+            break
+        partner = jumped
+    roots, dense = np.unique(partner, return_inverse=True)
+    return dense[component], len(roots)
+
+def boruvka(n, u, v, w, check=_no_check):
+    u, v, w = as_edge_arrays(u, v, w)
+    order, ranks = _weight_ranks(w)
+    chosen = []
+    _boruvka_rounds(u, v, order, ranks, np.arange(n), n, np.flatnonzero(u != v), chosen, check)
+    return np.concatenate(chosen) if chosen else np.empty(0, dtype=np.int64)
+
+def _boruvka_rounds(u, v, order, ranks, component, num_components, live, chosen, check):
+    # Serial rounds until no edge crosses between components
+    while len(live):
+        check()
+        cu, cv = component[u[live]], component[v[live]]
+        crossing = cu != cv
+        live, cu, cv = live[crossing], cu[crossing], cv[crossing]
+        if not len(live):
+            break
+        best = component_minimums(num_components, cu, cv, ranks[live])
+        component, num_components = _contract_minimums(u, v, order, component, num_components, best, chosen)
+
+def _contract_minimums(u, v, order, component, num_components, best, chosen):
+    # Adds each component's minimum edge to chosen and merges along them
+    has_edge = best != NO_EDGE
+    picked = np.unique(best[has_edge])
+    chosen.append(order[picked])
+
+    # The component on the far side of each component's minimum edge
+    edges = order[best[has_edge]]
+    ends_u, ends_v = component[u[edges]], component[v[edges]]
+    owners = np.flatnonzero(has_edge)
+    partner = np.arange(num_components)
+    partner[owners] = np.where(ends_u == owners, ends_v, ends_u)
+    return contract(component, partner)
+
+# Parallel Borůvka. u, v, the edge ranks and the live edge ids go into shared
+# memory once per run, and every worker owns a fixed slice of the live ids.
+# Each round a worker looks up the component labels of its live edges, drops
+# the ones that became internal (compacting its slice in place) and takes the
+# segment-min over the rest. The main process only copies the component
+# labels in (one per vertex), merges the per-slice minimums and contracts.
+
+_shared = None
+
+def _shared_worker_init(specs):
+    global _shared
+    blocks = [shared_memory.SharedMemory(name=name) for name, _ in specs]
+    # Keep the blocks referenced: the arrays are only views of their buffers
+    _shared = blocks, [np.ndarray(size, dtype=np.int64, buffer=block.buf)
+                       for block, (_, size) in zip(blocks, specs)]
+
+def _shared_worker_round(num_components, start, count):
+    u, v, ranks, live, component = _shared[1]
+    edges = live[start:start + count]
+    cu, cv = component[u[edges]], component[v[edges]]
+    crossing = cu != cv
+    kept = edges[crossing]
+    live[start:start + len(kept)] = kept
+    best = component_minimums(num_components, cu[crossing], cv[crossing], ranks[kept])
+    found = np.flatnonzero(best != NO_EDGE)
+    return len(kept), found, best[found]
+
+class SharedBoruvka:
+    """The process pool and shared buffers of one parallel_boruvka run.
+
+    Use as a context manager; the pool and the buffers are released on exit.
+    live and component are the shared live edge ids and component labels.
+    """
+
+    def __init__(self, u, v, ranks, live, n, workers):
+        self.sources = (u, v, ranks, live)
+        self.n = n
+        self.workers = workers
+        self.blocks = []
+        self.pool = None
+
+    def __enter__(self):
+        try:
+            arrays = []
+            for size, values in [(len(a), a) for a in self.sources] + [(self.n, None)]:
+                block = shared_memory.SharedMemory(create=True, size=max(size, 1) * 8)
+                self.blocks.append(block)
+                array = np.ndarray(size, dtype=np.int64, buffer=block.buf)
+                if values is not None:
+                    array[:] = values
+                arrays.append(array)
+            self.live, self.component = arrays[3], arrays[4]
+            specs = [(block.name, len(array)) for block, array in zip(self.blocks, arrays)]
+            self.pool = ProcessPoolExecutor(self.workers, initializer=_shared_worker_init, initargs=(specs,))
+        except BaseException:
+            self.__exit__(None, None, None)
+            raise
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
+        self.live = self.component = None
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
+
+def parallel_boruvka(n, u, v, w, workers=None, min_chunk=50000, check=_no_check):
+    u, v, w = as_edge_arrays(u, v, w)
+    order, ranks = _weight_ranks(w)
+    live = np.flatnonzero(u != v)
+    workers = workers or os.cpu_count() or 1
+    chunks = min(workers, len(live) // min_chunk)
+    component, num_components = np.arange(n), n
+    chosen = []
+    if chunks >= 2:
+        with SharedBoruvka(u, v, ranks, live, n, workers) as shared:
+            bounds = np.linspace(0, len(live), chunks + 1).astype(np.int64).tolist()
+            slices = [(start, stop - start) for start, stop in zip(bounds, bounds[1:])]
+            # Late rounds are too small to be worth the round trips; they finish serially
+            while sum(count for _, count in slices) >= 2 * min_chunk:
+                check()
+                shared.component[:] = component
+                futures = [shared.pool.submit(_shared_worker_round, num_components, start, count)
+                           for start, count in slices]
+                best = np.full(num_components, NO_EDGE, dtype=np.int64)
+                for i, future in enumerate(futures):
+                    count, found, minimums = future.result()
+                    slices[i] = (slices[i][0], count)
+                    np.minimum.at(best, found, minimums)
+                component, num_components = _contract_minimums(u, v, order, component, num_components, best, chosen)
+            live = np.concatenate([shared.live[start:start + count] for start, count in slices])
+    _boruvka_rounds(u, v, order, ranks, component, num_components, live, chosen, check)
+    return np.concatenate(chosen) if chosen else np.empty(0, dtype=np.int64)
+
+# Dynamic MST. Tree edges are kept in a link-cut tree where every edge is a node
+# of its own between its endpoints, so a path aggregate finds the heaviest edge.
+
+class LinkCutTree:
+    """Sleator-Tarjan link-cut trees over node ids, with path maximum.
+
+    Every node carries a value; path_max(x, y) returns the node with the
+    largest value on the tree path between x and y. All operations are
+    O(log n) amortised.
+    """
+
+    def __init__(self):
+        self.left = []
+        self.right = []
+        self.parent = []
+        self.flipped = []
+        self.value = []
+        self.best = []
+
+    def add_node(self, value=float('-inf')):
+        x = len(self.value)
+        self.left.append(-1)
+        self.right.append(-1)
+        self.parent.append(-1)
+        self.flipped.append(False)
+        self.value.append(value)
+        self.best.append(x)
+        return x
+
+    def _is_splay_root(self, x):
+        p = self.parent[x]
+        return p < 0 or (self.left[p] != x and self.right[p] != x)
+
+    def _pull(self, x):
+        value, best = self.value, self.best
+        b = x
+        child = self.left[x]
+        if child >= 0 and value[best[child]] > value[b]:
+            b = best[child]
+        child = self.right[x]
+        if child >= 0 and value[best[child]] > value[b]:
+            b = best[child]
+        best[x] = b
+
+    def _push(self, x):
+        if self.flipped[x]:
+            left, right = self.left[x], self.right[x]
+            self.left[x], self.right[x] = right, left
+            for child in (left, right):
+                if child >= 0:
+                    self.flipped[child] = not self.flipped[child]
+            self.flipped[x] = False
+
+    def _rotate(self, x):
+        left, right, parent = self.left, self.right, self.parent
+        p = parent[x]
+        g = parent[p]
+        if g >= 0:
+            if left[g] == p:
+                left[g] = x
+            elif right[g] == p:
+                right[g] = x
+        parent[x] = g
+        if left[p] == x:
+            left[p] = right[x]
+            if right[x] >= 0:
+                parent[right[x]] = p
+            right[x] = p
+        else:
+            right[p] = left[x]
+            if left[x] >= 0:
+                parent[left[x]] = p
+            left[x] = p
+        parent[p] = x
+        self._pull(p)
+        self._pull(x)
+
+    def _splay(self, x):
+        # Pending flips are pushed top-down before any rotation
+        path = [x]
+        while not self._is_splay_root(path[-1]):
+            path.append(self.parent[path[-1]])
+        for y in reversed(path):
+            self._push(y)
+        while not self._is_splay_root(x):
+            p = self.parent[x]
+            if not self._is_splay_root(p):
+                g = self.parent[p]
+                self._rotate(p if (self.left[g] == p) == (self.left[p] == x) else x)
+            self._rotate(x)
+
+    def _access(self, x):
+        last = -1
+        y = x
+        while y >= 0:
+            self._splay(y)
+            self.right[y] = last
+            self._pull(y)
+            last = y
+            y = self.parent[y]
+        self._splay(x)
+
+    def make_root(self, x):
+        self._access(x)
+        self.flipped[x] = not self.flipped[x]
+
+    def find_root(self, x):
+        self._access(x)
+        while True:
+            self._push(x)
+            if self.left[x] < 0:
+                break
+            x = self.left[x]
+        self._splay(x)
+        return x
+
+    def connected(self, x, y):
+        return x == y or self.find_root(x) == self.find_root(y)
+
+    def link(self, x, y):
+        # x and y must be in different trees
+        self.make_root(x)
+        self.parent[x] = y
+
+    def cut(self, x, y):
+        # x and y must be adjacent
+        self.make_root(x)
+        self._access(y)
+        self.left[y] = -1
+        self.parent[x] = -1
+        self._pull(y)
+
+    def set_value(self, x, value):
+        self._access(x)
+        self.value[x] = value
+        self._pull(x)
+
+    def path_max(self, x, y):
+        # Heaviest node on the path from x to y, or -1 when they are not connected
+        self.make_root(x)
+        if self.find_root(y) != x:
+            return -1
+        self._access(y)
+        return self.best[y]
+
+class DynamicMST:
+    """A minimum spanning forest kept up to date as edges change.
+
+    add_edge applies the cycle property: if the endpoints are already joined,
+    the heaviest edge on the tree path between them is swapped out when the
+    new edge is lighter. That costs O(log n). Removing a tree edge, or making
+    one heavier, scans the non-tree edges for the lightest reconnection, which
+    is O(m log n) in the worst case; every other change is O(log n).
+    """
+
+    def __init__(self):
+        self.tree = LinkCutTree()
+        self.nodes = {}          # vertex -> link-cut node
+        self.tree_edges = {}     # (u, v) -> link-cut node of the edge
+        self.edge_ends = {}      # link-cut node of an edge -> (u, v)
+        self.free_edge_nodes = []
+        self.non_tree_edges = {} # (u, v) -> weight
+        self.total_weight = 0
+
+    @classmethod
+    def from_forest(cls, tree_edges, other_edges=(), check=_no_check):
+        # Seed from a known minimum spanning forest without re-checking it
+        mst = cls()
+        for i, (u, v, weight) in enumerate(tree_edges):
+            if not i % CHECK_EVERY:
+                check()
+            mst._link(mst._key(u, v), weight)
+        for u, v, weight in other_edges:
+            mst.non_tree_edges[mst._key(u, v)] = weight
+        return mst
+
+    @staticmethod
+    def _key(u, v):
+        # Undirected edges are stored under one canonical orientation
+        return (u, v) if (type(u).__name__, u) <= (type(v).__name__, v) else (v, u)
+
+    def _node(self, vertex):
+        node = self.nodes.get(vertex)
+        if node is None:
+            node = self.nodes[vertex] = self.tree.add_node()
+        return node
+
+    def _link(self, key, weight):
+        if self.free_edge_nodes:
+            e = self.free_edge_nodes.pop()
+            self.tree.value[e] = weight
+            self.tree.best[e] = e
+        else:
+            e = self.tree.add_node(weight)
+        u, v = key
+        # e is a lone node, so linking it first needs no re-rooting of a real tree
+        self.tree.link(e, self._node(v))
+        self.tree.link(self._node(u), e)
+        self.tree_edges[key] = e
+        self.edge_ends[e] = key
+        self.total_weight += weight
+
+    def _cut(self, key):
+        e = self.tree_edges.pop(key)
+        del self.edge_ends[e]
+        u, v = key
+        self.tree.cut(self.nodes[u], e)
+        self.tree.cut(e, self.nodes[v])
+        self.free_edge_nodes.append(e)
+        weight = self.tree.value[e]
+        self.total_weight -= weight
+        return weight
+
+    def __contains__(self, edge):
+        return self._key(*edge) in self.tree_edges
+
+    def __len__(self):
+        return len(self.tree_edges)
+
+    def weight(self, u, v):
+        key = self._key(u, v)
+        if key in self.tree_edges:
+            return self.tree.value[self.tree_edges[key]]
+        return self.non_tree_edges[key]
+
+    def edges(self):
+        # (u, v, weight) for every tree edge
+        for (u, v), e in self.tree_edges.items():
+            yield u, v, self.tree.value[e]
+
+    def add_edge(self, u, v, weight):
+        """Insert an edge, or change its weight if it exists already."""
+        key = self._key(u, v)
+        if key in self.tree_edges or key in self.non_tree_edges:
+            self.set_edge_weight(u, v, weight)
+            return
+        if u == v:
+            self.non_tree_edges[key] = weight
+            return
+        heaviest = self.tree.path_max(self._node(u), self._node(v))
+        if heaviest < 0:
+            self._link(key, weight)
+        elif self.tree.value[heaviest] > weight:
+            old_key = self.edge_ends[heaviest]
+            self.non_tree_edges[old_key] = self._cut(old_key)
+            self._link(key, weight)
+        else:
+            self.non_tree_edges[key] = weight
+
+    def set_edge_weight(self, u, v, weight):
+        key = self._key(u, v)
+        if key in self.non_tree_edges:
+            # A cheaper non-tree edge may now beat a tree edge: re-insert it
+            del self.non_tree_edges[key]
+            self.add_edge(u, v, weight)
+        elif self.tree.value[self.tree_edges[key]] >= weight:
+            # A tree edge that gets lighter stays in the tree
+            e = self.tree_edges[key]
+            self.total_weight += weight - self.tree.value[e]
+            self.tree.set_value(e, weight)
+        else:
+            self._cut(key)
+            self.non_tree_edges[key] = weight
+            self._reconnect(key)
+
+    def remove_edge(self, u, v):
+        key = self._key(u, v)
+        if key in self.non_tree_edges:
+            del self.non_tree_edges[key]
+        else:
+            self._cut(key)
+            self._reconnect(key)
+
+    def _reconnect(self, key):
+        # The lightest non-tree edge across the cut left by removing key, if any
+        u, v = key
+        a, b = self.nodes[u], self.nodes[v]
+        root_a, root_b = self.tree.find_root(a), self.tree.find_root(b)
+        best = None
+        for (x, y), weight in self.non_tree_edges.items():
+            if best is not None and weight >= best[1]:
+                continue
+            rx, ry = self.tree.find_root(self._node(x)), self.tree.find_root(self._node(y))
+            if rx != ry and {rx, ry} == {root_a, root_b}:
+                best = ((x, y), weight)
+        if best is not None:
+            del self.non_tree_edges[best[0]]
+            self._link(*best)
+
+ENGINES = {"kruskal": kruskal, "prim": prim, "boruvka": boruvka, "parallel-boruvka": parallel_boruvka}
+
+def minimum_spanning_forest(n, u, v, w, algorithm="kruskal", check=_no_check):
+    try:
+        engine = ENGINES[algorithm]
+    except KeyError:
+        raise ValueError(f"Unknown MST algorithm '{algorithm}'. Choose from: {', '.join(ENGINES)}.") from None
+    return engine(n, u, v, w, check=check)
@@ -0,0 +1,200 @@
+"""Minimum spanning forests of edge lists larger than memory.
+
+The edge list is read in chunks; each chunk is sorted by weight in memory and
+written to a temporary run file. The runs are then k-way merged and streamed
+through an array-backed union-find, and every accepted edge is written out as
+soon as it is known. Memory holds one chunk while sorting, one block per run
+while merging, and a few bytes per vertex.
+
+Edge lists are text ("from,to[,weight]" rows, CSV or TSV) or binary records of
+int64 from, int64 to and float64 weight, the same layout PATH.py reads.
+"""
+from array import array
+import csv
+import heapq
+import os
+import tempfile
+
+import numpy as np
+
+import graphfile
+
+EDGE_DTYPE = np.dtype([("u", "<i8"), ("v", "<i8"), ("w", "<f8")])
+
+class UnionFind:
+    """Disjoint sets over the ids 0..n-1.
+
+    Parents are an int64 array and ranks a byte array, so memory is nine
+    bytes per vertex whatever the number of edges.
+    """
+
+    def __init__(self, n=0):
+        self.parent = array('q', range(n))
+        self.rank = array('B', bytes(n))
+
+    def find(self, x):
+        # Path halving: every other node on the path points to its grandparent
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a, b):
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        rank = self.rank
+        if rank[a] < rank[b]:
+            a, b = b, a
+        self.parent[b] = a
+        if rank[a] == rank[b]:
+            rank[a] += 1
+        return True
+
+def edge_format(path, fmt=None):
+    if fmt is not None:
+        return fmt
+    return {".tsv": "tsv", ".bin": "bin"}.get(os.path.splitext(path)[1].lower(), "csv")
+
+def read_edge_chunks(path, fmt=None, chunk_edges=1000000, labels=None):
+    """Yield EDGE_DTYPE arrays of at most chunk_edges edges.
+
+    Binary files carry integer vertex ids already. Text labels are numbered in
+    order of first appearance; pass a dict as labels to receive that mapping.
+    A first text row naming the columns (see graphfile.HEADER_NAMES) or with a
+    non-numeric weight is a header. Malformed rows raise ValueError.
+    """
+    fmt = edge_format(path, fmt)
+    if fmt == "bin":
+        with open(path, "rb") as f:
+            while True:
+                chunk = np.fromfile(f, dtype=EDGE_DTYPE, count=chunk_edges)
+                if not len(chunk):
+                    return
+                yield chunk
+
+    if labels is None:
+        labels = {}
+    chunk = np.empty(chunk_edges, dtype=EDGE_DTYPE)
+    size = 0
+    with open(path, newline="") as f:
+        for line_number, row in enumerate(csv.reader(f, delimiter="\t" if fmt == "tsv" else ","), 1):
+            if not row or row[0].startswith("#"):
+                continue
+            if line_number == 1 and graphfile.is_header_row(row):
+                continue
+            if len(row) < 2:
+                raise ValueError(f"{path}:{line_number}: expected from,to[,weight]")
+            # An empty weight, as from a trailing separator, means the default
+            weight = row[2].strip() if len(row) > 2 else ""
+            weight = weight or "1"
+            try:
+                weight = float(weight)
+            except ValueError:
+                if line_number == 1:
+                    continue  # Header row
+                raise ValueError(f"{path}:{line_number}: invalid edge weight {weight!r}")
+            ids = []
+            for label in (row[0].strip(), row[1].strip()):
+                i = labels.get(label)
+                if i is None:
+                    i = labels[label] = len(labels)
+                ids.append(i)
+            chunk[size] = (ids[0], ids[1], weight)
+            size += 1
+            if size == chunk_edges:
+                yield chunk
+                chunk = np.empty(chunk_edges, dtype=EDGE_DTYPE)
+                size = 0
+    if size:
+        yield chunk[:size]
+
+def write_sorted_runs(chunks, directory):
+    # One weight-sorted run file per chunk; returns the run paths and the vertex count
+    paths = []
+    num_vertices = 0
+    for chunk in chunks:
+        chunk = chunk[np.argsort(chunk["w"], kind="stable")]
+        num_vertices = max(num_vertices, int(chunk["u"].max()) + 1, int(chunk["v"].max()) + 1)
+        path = os.path.join(directory, f"run{len(paths):06d}.bin")
+        chunk.tofile(path)
+        paths.append(path)
+    return paths, num_vertices
+
+def iter_run(path, block_edges=65536):
+    # (weight, u, v) from one run file, read a block at a time
+    with open(path, "rb") as f:
+        while True:
+            block = np.fromfile(f, dtype=EDGE_DTYPE, count=block_edges)
+            if not len(block):
+                return
+            yield from zip(block["w"].tolist(), block["u"].tolist(), block["v"].tolist())
+
+class EdgeWriter:
+    """Streams (u, v, weight) edges to a text or binary edge list."""
+
+    def __init__(self, f, fmt="csv", names=None, buffer_edges=65536):
+        self.f = f
+        self.fmt = fmt
+        self.names = names
+        self.buffer = []
+        self.buffer_edges = buffer_edges
+        if fmt != "bin":
+            self.writer = csv.writer(f, delimiter="\t" if fmt == "tsv" else ",", lineterminator="\n")
+
+    def write(self, u, v, weight):
+        self.buffer.append((u, v, weight))
+        if len(self.buffer) >= self.buffer_edges:
+            self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return
+        if self.fmt == "bin":
+            self.f.write(np.array(self.buffer, dtype=EDGE_DTYPE).tobytes())
+        else:
+            names = self.names
+            self.writer.writerows(
+                (names[u] if names else u, names[v] if names else v, int(w) if w.is_integer() else w)
+                for u, v, w in self.buffer)
+        self.buffer.clear()
+
+def external_kruskal(path, output, fmt=None, output_format=None, chunk_edges=1000000, tmpdir=None):
+    """Write the minimum spanning forest of the edge list at path to output.
+
+    output is a path or an open file (text for csv/tsv, binary for bin).
+    Returns (number of forest edges, total weight).
+    """
+    fmt = edge_format(path, fmt)
+    labels = {}
+    with tempfile.TemporaryDirectory(prefix="mst-runs-", dir=tmpdir) as directory:
+        runs, num_vertices = write_sorted_runs(read_edge_chunks(path, fmt, chunk_edges, labels), directory)
+        if fmt != "bin":
+            num_vertices = len(labels)
+        # Text inputs are written back with their labels, binary ones with ids
+        names = list(labels) if fmt != "bin" else None
+
+        if isinstance(output, (str, os.PathLike)):
+            output_format = output_format or edge_format(output)
+            f = open(output, "wb") if output_format == "bin" else open(output, "w", newline="")
+        else:
+            output_format = output_format or "csv"
+            f = output
+        sets = UnionFind(num_vertices)
+        accepted = 0
+        total = 0.0
+        try:
+            writer = EdgeWriter(f, output_format, names)
+            for weight, u, v in heapq.merge(*(iter_run(run) for run in runs)):
+                if sets.union(u, v):
+                    writer.write(u, v, weight)
+                    accepted += 1
+                    total += weight
+                    if accepted == num_vertices - 1:
+                        break
+            writer.flush()
+        finally:
+            if f is not output:
+                f.close()
+    return accepted, total